@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+import pyarrow as pa
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from scripts.seed import DEFAULT_START_DATE, generate_data
+from src.core import settings
+from src.core.encoding import table_schema
+from src.db import get_session
+from src.db.ingest import ingest
+from src.main import app
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# -------------------------------
+# BENCHMARK CONFIGURATION
+# -------------------------------
+SCALES = {"1d": 1, "30d": 30, "1y": 365}
+# ``None`` spans the whole seeded range
+WIDTHS = {"1h": timedelta(hours=1), "1d": timedelta(days=1), "full": None}
+SUBSETS = {"all": None, "power": ["power"]}
+BASELINE = Path(__file__).with_name("benchmark_baseline.json")
+
+# Metrics where a higher value is a regression, and the opposite. p99 of
+# a few dozen requests is too noisy to gate on, and peak RSS covers the
+# whole run up to that scenario, so both are only reported.
+HIGHER_IS_WORSE = ["p50_ms", "p95_ms"]
+LOWER_IS_WORSE = ["rows_per_s"]
+
+
+def seed(engine: Engine, days: int):
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    df = generate_data(DEFAULT_START_DATE, days)
+    table = pa.Table.from_pandas(
+        df, schema=table_schema(list(df.columns)), preserve_index=False
+    )
+
+    # The ingest path creates the monthly partitions on PostgreSQL
+    with Session(engine) as session:
+        ingest(session, table, settings.ingest_batch_size)
+    logger.info(f"Seeded {len(df)} rows ({days} days)")
+
+
+def peak_rss_mb() -> float:
+    # High-water mark of the whole process so far, not of one scenario.
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    params: dict,
+    requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Send ``requests`` GETs to /data, ``concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one() -> httpx.Response:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get("/data", params=params)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+            return response
+
+    # Untimed, so cold database pages don't land in the percentiles
+    (await client.get("/data", params=params)).raise_for_status()
+
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    rows = len(responses[0].json())
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+
+    return {
+        "rows": rows,
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "rows_per_s": round(rows * requests / elapsed),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+async def run_scale(
+    scale: str, requests: int, concurrency: int
+) -> Dict[str, Dict[str, float]]:
+    days = SCALES[scale]
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+        for width_name, width in WIDTHS.items():
+            width = width or timedelta(days=days)
+            if width > timedelta(days=days):
+                continue
+
+            for subset_name, variables in SUBSETS.items():
+                params = {
+                    "start": DEFAULT_START_DATE.isoformat(),
+                    "end": (DEFAULT_START_DATE + width).isoformat(),
+                }
+                if variables is not None:
+                    params["variables"] = variables
+
+                name = f"{scale}/{width_name}/{subset_name}"
+                results[name] = await drive(
+                    client, params, requests, concurrency
+                )
+                logger.info(f"{name}: {results[name]}")
+
+    return results
+
+
+def run(
+    scales: List[str],
+    requests: int,
+    concurrency: int,
+    db_url: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    directory = tempfile.TemporaryDirectory()
+    engine = create_engine(
+        db_url or f"sqlite:///{directory.name}/benchmark.db",
+        connect_args={"check_same_thread": False} if db_url is None else {},
+    )
+
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    results = {}
+
+    try:
+        for scale in scales:
+            seed(engine, SCALES[scale])
+            results.update(
+                asyncio.run(run_scale(scale, requests, concurrency))
+            )
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+        directory.cleanup()
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Scenarios that got worse than the baseline by more than tolerance."""
+    regressions = []
+
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        for metric in HIGHER_IS_WORSE:
+            if current[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {current[metric]} > {reference[metric]}"
+                )
+        for metric in LOWER_IS_WORSE:
+            if current[metric] < reference[metric] * (1 - tolerance):
+                regressions.append(
+                    f"{name} {metric}: {current[metric]} < {reference[metric]}"
+                )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark GET /data against a stored baseline"
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=list(SCALES),
+        default=list(SCALES),
+        help="Seeded data sizes to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=20,
+        help="Requests per scenario (default: 20)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Requests in flight at once (default: 8)",
+    )
+    parser.add_argument(
+        "--db-url",
+        type=str,
+        help="Database to seed and query (default: temporary SQLite file)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE,
+        help=f"Baseline results file (default: {BASELINE.name})",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown before failing (default: 0.5)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline",
+    )
+
+    args = parser.parse_args()
+
+    results = run(args.scales, args.requests, args.concurrency, args.db_url)
+    results["_meta"] = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        logger.info(f"Baseline written to {args.baseline}")
+        exit(0)
+
+    if not args.baseline.exists():
+        logger.warning(
+            f"No baseline at {args.baseline}, run with --update-baseline"
+        )
+        exit(0)
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(
+        {k: v for k, v in results.items() if not k.startswith("_")},
+        baseline,
+        args.tolerance,
+    )
+
+    if regressions:
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        exit(1)
+
+    logger.info("No regressions against the baseline")
@@ -6,10 +6,14 @@ from typing import List
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from sqlmodel import select
 
 from src.core import settings
+from src.core.cache import day_cache
+from src.core.encoding import table_schema
 from src.db import get_session
+from src.db.ingest import ingest
 from src.db.models import Data
 
 settings.source_db_url = ""
@@ -98,19 +102,15 @@ def seed_database(start_date: datetime, days: int):
         )
     else:
         logger.info(f"Inserting {len(df)} rows...")
-    records = [
-        Data(
-            timestamp=row.timestamp.to_pydatetime(),
-            wind_speed=float(row.wind_speed),
-            power=float(row.power),
-            ambient_temperature=float(row.ambient_temperature),
-        )
-        for row in df.itertuples(index=False)
-    ]
+    table = pa.Table.from_pandas(
+        df, schema=table_schema(list(df.columns)), preserve_index=False
+    )
 
+    # The write path of POST /data/ingest: COPY on PostgreSQL
     with get_db_session() as session:
-        session.bulk_save_objects(records)
-        session.commit()
+        ingest(session, table, settings.ingest_batch_size)
+
+    day_cache.invalidate(df.timestamp.dt.date.unique())
 
     logger.info("Seed completed successfully.")
     logger.info(f"Data range: {df.timestamp.min()} → {df.timestamp.max()}")
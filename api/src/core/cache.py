@@ -0,0 +1,196 @@
+import os
+import threading
+import time as clock
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+from src.core import settings
+from src.core.encoding import to_table
+
+Fetch = Callable[[datetime, datetime], Sequence[tuple]]
+
+
+class DayBlockCache:
+    """Per-day columnar blocks of ``/data`` rows shared through a directory.
+
+    Blocks are Arrow IPC files keyed by (day, variables), read through
+    memory mapping. Any worker process pointed at the same directory
+    reuses them. The least recently used blocks are evicted once the
+    directory grows past ``max_bytes``. Only days that are already over
+    are cached; writers call :meth:`invalidate` after inserting rows.
+    Invalidations are stamped in the directory, so a block fetched
+    before one is never stored after it, in any process.
+    """
+
+    def __init__(self, directory: Optional[str], max_bytes: int):
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _path(self, day: date, fields: List[str]) -> Path:
+        return self.directory / f"{day.isoformat()}_{'-'.join(fields)}.arrow"
+
+    def _stamp(self, day: date) -> Path:
+        return self.directory / f".{day.isoformat()}.invalidated"
+
+    def _invalidated_at(self, day: date) -> int:
+        try:
+            return int(self._stamp(day).read_text())
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            # Being written right now
+            return clock.time_ns()
+
+    def _count(self, hits: int, misses: int):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _load(self, day: date, fields: List[str]) -> Optional[pa.Table]:
+        path = self._path(day, fields)
+
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+            os.utime(path)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+
+        return table
+
+    def _store(
+        self, day: date, fields: List[str], table: pa.Table, fetched_at: int
+    ):
+        """Store a block fetched at ``fetched_at``, unless it is stale."""
+        if self._invalidated_at(day) >= fetched_at:
+            return
+
+        path = self._path(day, fields)
+        partial = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+
+        with pa.OSFile(str(partial), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        # Atomic, so other workers never see a half-written block
+        os.replace(partial, path)
+
+        # Invalidated while the block was being written
+        if self._invalidated_at(day) >= fetched_at:
+            path.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        blocks = []
+        for path in self.directory.glob("*.arrow"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blocks.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in blocks)
+        for _, size, path in sorted(blocks):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, days: Iterable[date]):
+        if not self.enabled:
+            return
+
+        for day in set(days):
+            self._stamp(day).write_text(str(clock.time_ns()))
+            for path in self.directory.glob(f"{day.isoformat()}_*.arrow"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        blocks = list(self.directory.glob("*.arrow")) if self.enabled else []
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "blocks": len(blocks),
+            "bytes": sum(path.stat().st_size for path in blocks),
+        }
+
+    def read(
+        self,
+        start: datetime,
+        end: datetime,
+        fields: List[str],
+        fetch: Fetch,
+    ) -> List[tuple]:
+        """Rows of ``[start, end]``, answered from blocks where possible.
+
+        Days without a block are read with a single ``fetch`` call that
+        covers all of them, and the days already over are stored.
+        """
+        # Timestamps are UTC
+        today = datetime.now(timezone.utc).date()
+        days = [
+            start.date() + timedelta(days=offset)
+            for offset in range((end.date() - start.date()).days + 1)
+        ]
+
+        tables = {}
+        for day in days:
+            if day < today:
+                tables[day] = self._load(day, fields)
+
+        missing = [day for day in days if tables.get(day) is None]
+        self._count(len(days) - len(missing), len(missing))
+
+        if missing:
+            fetched_at = clock.time_ns()
+            rows = fetch(
+                datetime.combine(missing[0], time()),
+                datetime.combine(missing[-1] + timedelta(days=1), time()),
+            )
+            fetched = to_table(["timestamp", *fields], rows)
+            timestamps = fetched.column("timestamp").to_numpy()
+
+            for day in missing:
+                bounds = np.array(
+                    [day, day + timedelta(days=1)], dtype="datetime64[us]"
+                )
+                lower, upper = np.searchsorted(timestamps, bounds)
+                tables[day] = fetched.slice(lower, upper - lower)
+
+                if day < today:
+                    self._store(day, fields, tables[day], fetched_at)
+
+        table = pa.concat_tables(tables[day] for day in days)
+        timestamps = table.column("timestamp").to_numpy()
+        lower = np.searchsorted(timestamps, np.datetime64(start, "us"))
+        upper = np.searchsorted(
+            timestamps, np.datetime64(end, "us"), side="right"
+        )
+        table = table.slice(lower, upper - lower)
+
+        return list(
+            zip(
+                table.column("timestamp").to_numpy().tolist(),
+                *(table.column(field).to_pylist() for field in fields),
+            )
+        )
+
+
+day_cache = DayBlockCache(settings.cache_dir, settings.cache_max_bytes)
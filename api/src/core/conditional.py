@@ -0,0 +1,57 @@
+import gzip
+import hashlib
+from typing import Dict, Optional, Tuple
+
+import zstandard
+from fastapi import Request
+
+# Bodies smaller than this are not worth compressing
+MINIMUM_SIZE = 1000
+
+
+def make_etag(*parts) -> str:
+    """Weak validator, since the same rows may be sent compressed or not."""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def validator_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Vary": "Accept"}
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Evaluate If-None-Match against ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is None:
+        return False
+
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    opaque = etag.removeprefix("W/")
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == opaque for tag in candidates
+    )
+
+
+def compress(body: bytes, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+    """Compress with zstd or gzip, whichever the client accepts first.
+
+    Returns the body and its ``Content-Encoding``, if any.
+    """
+    if len(body) < MINIMUM_SIZE:
+        return body, None
+
+    for coding in accept_encoding.split(","):
+        coding = coding.split(";")[0].strip().lower()
+
+        if coding == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(body), coding
+
+        if coding == "gzip":
+            return gzip.compress(body, compresslevel=6), coding
+
+    return body, None
@@ -0,0 +1,45 @@
+from typing import List, Sequence
+
+import numpy as np
+
+
+def minmax_indices(
+    timestamps: np.ndarray, values: np.ndarray, max_points: int
+) -> np.ndarray:
+    """Row indices keeping the minimum and maximum of every column per bucket.
+
+    Rows are split into equal-width time buckets, sized so that the kept
+    rows never exceed ``max_points``. Picking actual extremes (rather than
+    averaging) keeps spikes visible at any zoom level.
+    """
+    size, width = values.shape
+    buckets = max(1, max_points // (2 * width))
+
+    offsets = timestamps - timestamps[0]
+    # In float64, as offsets * buckets overflows int64 over long ranges
+    bucket = (offsets / (offsets[-1] + 1) * buckets).astype(np.int64)
+
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], size] - 1
+
+    keep = []
+    for column in values.T:
+        order = np.lexsort((column, bucket))
+        keep += [order[starts], order[ends]]
+
+    return np.unique(np.concatenate(keep))
+
+
+def downsample(rows: Sequence[tuple], max_points: int) -> List[tuple]:
+    """Reduce ``(timestamp, *values)`` rows to at most ``max_points``."""
+    if len(rows) <= max_points:
+        return list(rows)
+
+    timestamps = np.array(
+        [row[0] for row in rows], dtype="datetime64[us]"
+    ).astype(np.int64)
+    values = np.array([row[1:] for row in rows], dtype=np.float64)
+
+    return [
+        rows[index] for index in minmax_indices(timestamps, values, max_points)
+    ]
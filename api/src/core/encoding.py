@@ -0,0 +1,134 @@
+import io
+from typing import List, Sequence
+
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+
+JSON = "application/json"
+NDJSON = "application/x-ndjson"
+ARROW = "application/vnd.apache.arrow.stream"
+PARQUET = "application/x-parquet"
+CSV = "text/csv"
+
+
+def negotiate(accept: str, default: str = JSON) -> str:
+    """Pick the first supported media type listed in an Accept header."""
+    supported = (JSON, NDJSON, ARROW, PARQUET)
+
+    for media_type in accept.split(","):
+        media_type = media_type.split(";")[0].strip()
+        if media_type in supported:
+            return media_type
+
+    return default
+
+
+def encode_rows(keys: List[str], rows: Sequence[tuple]) -> bytes:
+    return orjson.dumps([dict(zip(keys, row)) for row in rows])
+
+
+def encode_ndjson(keys: List[str], rows: Sequence[tuple]) -> bytes:
+    return b"".join(
+        orjson.dumps(dict(zip(keys, row)), option=orjson.OPT_APPEND_NEWLINE)
+        for row in rows
+    )
+
+
+def table_schema(keys: List[str]) -> pa.Schema:
+    """A timestamp column followed by float64 ones."""
+    return pa.schema(
+        [
+            (key, pa.timestamp("us") if key == "timestamp" else pa.float64())
+            for key in keys
+        ]
+    )
+
+
+def to_table(keys: List[str], rows: Sequence[tuple]) -> pa.Table:
+    """Columnar table with a timestamp column followed by float64 ones."""
+    columns = list(zip(*rows)) if rows else [() for _ in keys]
+    schema = table_schema(keys)
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(column, type=field.type)
+            for column, field in zip(columns, schema)
+        ],
+        schema=schema,
+    )
+
+
+def encode_arrow(keys: List[str], rows: Sequence[tuple]) -> bytes:
+    table = to_table(keys, rows)
+    sink = pa.BufferOutputStream()
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def encode_parquet(keys: List[str], rows: Sequence[tuple]) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(to_table(keys, rows), sink)
+
+    return sink.getvalue()
+
+
+ENCODERS = {
+    JSON: encode_rows,
+    NDJSON: encode_ndjson,
+    ARROW: encode_arrow,
+    PARQUET: encode_parquet,
+}
+
+
+def decode_ndjson(schema: pa.Schema, body: bytes) -> pa.Table:
+    return pa_json.read_json(
+        pa.BufferReader(body),
+        parse_options=pa_json.ParseOptions(explicit_schema=schema),
+    )
+
+
+def decode_csv(schema: pa.Schema, body: bytes) -> pa.Table:
+    return pa_csv.read_csv(
+        pa.BufferReader(body),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=schema, include_columns=schema.names
+        ),
+    )
+
+
+def decode_arrow(schema: pa.Schema, body: bytes) -> pa.Table:
+    return pa.ipc.open_stream(body).read_all()
+
+
+DECODERS = {
+    NDJSON: decode_ndjson,
+    CSV: decode_csv,
+    ARROW: decode_arrow,
+}
+
+
+def decode_table(media_type: str, keys: List[str], body: bytes) -> pa.Table:
+    """Table with exactly the ``keys`` columns, parsed from an upload.
+
+    Raises ``ValueError`` (``pa.ArrowInvalid`` included) on a malformed
+    body, a missing column or an empty value.
+    """
+    schema = table_schema(keys)
+    table = DECODERS[media_type](schema, body)
+
+    missing = [key for key in keys if key not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    table = table.select(keys).cast(schema)
+    empty = [key for key in keys if table.column(key).null_count]
+    if empty:
+        raise ValueError(f"Empty values in columns: {', '.join(empty)}")
+
+    return table
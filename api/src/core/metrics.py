@@ -0,0 +1,137 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from prometheus_client import Counter, Histogram
+
+# Upper bounds of the rows-returned label of the latency histogram
+SIZE_BUCKETS = [0, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+REQUEST_LATENCY = Histogram(
+    "api_request_duration_seconds",
+    "Time until the last byte of the response is sent",
+    ["route", "method", "rows_le"],
+)
+STAGE_LATENCY = Histogram(
+    "api_stage_duration_seconds",
+    "Time spent in each stage of a request",
+    ["route", "stage"],
+)
+ROWS_RETURNED = Counter(
+    "api_rows_returned_total", "Rows sent in responses", ["route"]
+)
+BYTES_SENT = Counter(
+    "api_response_bytes_total", "Body bytes sent in responses", ["route"]
+)
+POOL_WAIT = Histogram(
+    "api_db_pool_wait_seconds",
+    "Time waiting for a connection from the SQLAlchemy pool",
+)
+
+
+@dataclass
+class RequestMetrics:
+    stages: Dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    rows: Optional[int] = None
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def record(stage: str, seconds: float):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.stages[stage] += seconds
+
+
+def record_rows(rows: int):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.rows = (metrics.rows or 0) + rows
+
+
+@contextmanager
+def timed(stage: str):
+    """Add the time spent in the block to ``stage`` of this request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started)
+
+
+def size_bucket(rows: Optional[int]) -> str:
+    if rows is None:
+        return "none"
+
+    for bound in SIZE_BUCKETS:
+        if rows <= bound:
+            return str(bound)
+
+    return "+Inf"
+
+
+def server_timing(stages: Dict[str, float], total: float) -> str:
+    return ", ".join(
+        f"{stage};dur={seconds * 1000:.2f}"
+        for stage, seconds in [*stages.items(), ("total", total)]
+    )
+
+
+class MetricsMiddleware:
+    """Record per-route latency, stage timings, rows and bytes.
+
+    Stage timings measured so far are also sent in a ``Server-Timing``
+    header. Streamed responses only report the stages done before the
+    first byte there, while the histograms cover the whole body.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        sent = 0
+
+        async def send_wrapper(message):
+            nonlocal sent
+
+            if message["type"] == "http.response.start":
+                header = server_timing(
+                    metrics.stages, time.perf_counter() - started
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", header.encode()),
+                ]
+            elif message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+
+            REQUEST_LATENCY.labels(
+                route, scope["method"], size_bucket(metrics.rows)
+            ).observe(time.perf_counter() - started)
+            for stage, seconds in metrics.stages.items():
+                STAGE_LATENCY.labels(route, stage).observe(seconds)
+            ROWS_RETURNED.labels(route).inc(metrics.rows or 0)
+            BYTES_SENT.labels(route).inc(sent)
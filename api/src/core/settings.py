@@ -1,3 +1,5 @@
+from typing import Optional
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
@@ -6,3 +8,15 @@ load_dotenv()
 
 class Settings(BaseSettings):
     source_db_url: str
+    stream_chunk_size: int = 1000
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 256 * 1024 * 1024
+    batch_max_windows: int = 500
+    hot_tier_days: Optional[int] = None
+    hot_tier_refresh_seconds: float = 60
+    ingest_batch_size: int = 10_000
+    tail_poll_seconds: float = 0.5
+    tail_heartbeat_seconds: float = 15
@@ -1,9 +1,62 @@
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, TypeVar
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlmodel import Session
 
 from src.core import settings
+from src.core.metrics import POOL_WAIT, record, timed
+
+T = TypeVar("T")
+
+pool_options = (
+    {}
+    if make_url(settings.source_db_url).get_backend_name() == "sqlite"
+    else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+)
+
+engine = create_engine(settings.source_db_url, **pool_options)
+
+# Blocking database calls run here, sized to the connection pool so
+# threads never queue for a connection
+db_executor = ThreadPoolExecutor(
+    max_workers=settings.db_pool_size + settings.db_max_overflow,
+    thread_name_prefix="db",
+)
+
+
+async def run_db(func: Callable[..., T], *args) -> T:
+    """Run a blocking database call without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    # Carry the request context, so stage timings reach its metrics
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        db_executor, partial(context.run, func, *args)
+    )
+
+
+def fetch_all(session: Session, statement) -> List[tuple]:
+    """Run ``statement`` timing pool checkout, execution and hydration."""
+    started = time.perf_counter()
+    session.connection()
+    waited = time.perf_counter() - started
+    POOL_WAIT.observe(waited)
+    record("db-pool", waited)
+
+    with timed("db-execute"):
+        result = session.exec(statement)
 
-engine = create_engine(settings.source_db_url)
+    with timed("hydrate"):
+        return result.all()
 
 
 def get_session() -> Session:
@@ -0,0 +1,98 @@
+from datetime import datetime
+from itertools import groupby
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    and_,
+    column,
+    literal,
+    union_all,
+    values,
+)
+from sqlmodel import select
+
+from src.db.models import Data
+
+Window = Tuple[datetime, datetime]
+
+
+def windows_table(dialect: str, windows: Sequence[Window]):
+    """``(window_id, lower, upper)`` rows to join the data against."""
+    if dialect == "sqlite":
+        # SQLite has no column list on a VALUES alias
+        return union_all(
+            *(
+                select(
+                    literal(position, Integer).label("window_id"),
+                    literal(lower, DateTime).label("lower"),
+                    literal(upper, DateTime).label("upper"),
+                )
+                for position, (lower, upper) in enumerate(windows)
+            )
+        ).subquery("windows")
+
+    return values(
+        column("window_id", Integer),
+        column("lower", DateTime),
+        column("upper", DateTime),
+        name="windows",
+    ).data(
+        [
+            (position, lower, upper)
+            for position, (lower, upper) in enumerate(windows)
+        ]
+    )
+
+
+def batch_statement(
+    dialect: str, windows: Sequence[Window], fields: List[str]
+):
+    """Rows of every window in one query, ordered by window and time.
+
+    Each window is an index range scan on ``Data.timestamp``. A row in
+    overlapping windows is returned once per window.
+    """
+    table = windows_table(dialect, windows)
+
+    return (
+        select(
+            table.c.window_id,
+            Data.timestamp,
+            *(getattr(Data, field) for field in fields),
+        )
+        .join(
+            table,
+            and_(
+                Data.timestamp >= table.c.lower,
+                Data.timestamp <= table.c.upper,
+            ),
+        )
+        .order_by(table.c.window_id, Data.timestamp)
+    )
+
+
+def group_rows(
+    rows: Sequence[tuple],
+    size: int,
+    fields: List[str],
+    projections: List[List[str]],
+) -> List[List[tuple]]:
+    """Split ``(window_id, timestamp, *fields)`` rows per window.
+
+    Each window keeps only the fields listed in its projection.
+    """
+    positions: Dict[str, int] = {
+        field: offset for offset, field in enumerate(fields, start=2)
+    }
+    grouped: List[List[tuple]] = [[] for _ in range(size)]
+
+    for window_id, window_rows in groupby(rows, key=lambda row: row[0]):
+        offsets = [positions[field] for field in projections[window_id]]
+        grouped[window_id] = [
+            (row[1], *(row[offset] for offset in offsets))
+            for row in window_rows
+        ]
+
+    return grouped
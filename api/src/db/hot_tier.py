@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+import numpy as np
+from sqlmodel import Session, func, select
+
+from src.core import settings
+from src.db import engine, run_db
+from src.db.models import Data
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ["wind_speed", "power", "ambient_temperature"]
+
+
+class HotTier:
+    """The latest ``days`` of ``data`` held in NumPy arrays.
+
+    Rows live in preallocated buffers; the valid region slides forward as
+    new rows are appended and old ones fall out of the window. Buffers
+    are only written past the valid region and reallocated when full, so
+    a snapshot taken by a reader never changes under it. Every change
+    bumps a generation; a refresh whose reads predate a later change,
+    such as :meth:`clear`, is discarded instead of installed.
+    """
+
+    def __init__(self, days: Optional[int], fields: List[str] = FIELDS):
+        self.days = days
+        self.fields = fields
+        self._timestamps = np.empty(0, dtype="datetime64[us]")
+        self._columns = {field: np.empty(0) for field in fields}
+        self._start = 0
+        self._stop = 0
+        self.lower: Optional[np.datetime64] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.days is not None
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @property
+    def latest(self) -> Optional[datetime]:
+        if not len(self):
+            return None
+        return self._timestamps[self._stop - 1].astype(datetime)
+
+    def _snapshot(self):
+        with self._lock:
+            window = slice(self._start, self._stop)
+            return (
+                self._timestamps[window],
+                {
+                    field: column[window]
+                    for field, column in self._columns.items()
+                },
+                self.lower,
+            )
+
+    def read(
+        self, start: datetime, end: datetime, fields: List[str]
+    ) -> Optional[List[tuple]]:
+        """Rows of ``[start, end]``, or None when start is before the tier."""
+        timestamps, columns, lower = self._snapshot()
+
+        if lower is None or np.datetime64(start, "us") < lower:
+            return None
+
+        lower_index = np.searchsorted(timestamps, np.datetime64(start, "us"))
+        upper_index = np.searchsorted(
+            timestamps, np.datetime64(end, "us"), side="right"
+        )
+        window = slice(lower_index, upper_index)
+
+        return list(
+            zip(
+                timestamps[window].tolist(),
+                *(columns[field][window].tolist() for field in fields),
+            )
+        )
+
+    def clear(self):
+        """Forget all rows, so the next refresh reloads the window."""
+        with self._lock:
+            self._start = self._stop = 0
+            self.lower = None
+            self._generation += 1
+
+    def _arrays(self, rows: Sequence[tuple]):
+        columns = list(zip(*rows)) if rows else [()] * (1 + len(self.fields))
+        return (
+            np.array(columns[0], dtype="datetime64[us]"),
+            {
+                field: np.array(column, dtype=np.float64)
+                for field, column in zip(self.fields, columns[1:])
+            },
+        )
+
+    def _append(
+        self, rows: Sequence[tuple], generation: int, replace: bool = False
+    ):
+        """Add rows read while the tier was at ``generation``."""
+        timestamps, columns = self._arrays(rows)
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            buffers = self._timestamps, self._columns
+            start, stop = (0, 0) if replace else (self._start, self._stop)
+
+        size = stop - start + len(timestamps)
+        old_timestamps, old_columns = buffers
+
+        if replace or stop + len(timestamps) > len(old_timestamps):
+            # Fresh buffers with room to grow, leaving snapshots untouched
+            capacity = max(2 * size, 1024)
+            buffers = (
+                np.empty(capacity, dtype="datetime64[us]"),
+                {field: np.empty(capacity) for field in self.fields},
+            )
+            buffers[0][: stop - start] = old_timestamps[start:stop]
+            for field in self.fields:
+                buffers[1][field][: stop - start] = old_columns[field][
+                    start:stop
+                ]
+            start, stop = 0, stop - start
+
+        buffers[0][stop : stop + len(timestamps)] = timestamps
+        for field in self.fields:
+            buffers[1][field][stop : stop + len(timestamps)] = columns[field]
+        stop += len(timestamps)
+
+        if stop == start:
+            return
+
+        lower = buffers[0][stop - 1] - np.timedelta64(
+            timedelta(days=self.days)
+        )
+        start += int(np.searchsorted(buffers[0][start:stop], lower))
+
+        with self._lock:
+            # Changed meanwhile, the next refresh starts over
+            if generation != self._generation:
+                return
+            self._timestamps, self._columns = buffers
+            self._start, self._stop = start, stop
+            self.lower = lower
+            self._generation += 1
+
+    def refresh(self, session: Session):
+        """Append rows newer than the tier, or reload it when needed.
+
+        The tier is reloaded on first use and whenever the database holds
+        a different number of rows inside its window, as after a backfill.
+        """
+        columns = [getattr(Data, key) for key in ["timestamp", *self.fields]]
+
+        with self._lock:
+            generation = self._generation
+            latest, lower, size = self.latest, self.lower, len(self)
+
+        if latest is not None:
+            count = session.exec(
+                select(func.count()).where(
+                    Data.timestamp >= lower.astype(datetime),
+                    Data.timestamp <= latest,
+                )
+            ).one()
+            if count != size:
+                latest = None
+
+        if latest is None:
+            newest = session.exec(select(func.max(Data.timestamp))).one()
+            if newest is None:
+                return
+
+            rows = session.exec(
+                select(*columns)
+                .where(Data.timestamp >= newest - timedelta(days=self.days))
+                .order_by(Data.timestamp)
+            ).all()
+            self._append(rows, generation, replace=True)
+            logger.info(f"Hot tier loaded with {len(self)} rows")
+            return
+
+        rows = session.exec(
+            select(*columns)
+            .where(Data.timestamp > latest)
+            .order_by(Data.timestamp)
+        ).all()
+        self._append(rows, generation)
+
+
+async def keep_fresh(tier: HotTier, interval: float):
+    """Refresh ``tier`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            with Session(engine) as session:
+                await run_db(tier.refresh, session)
+        except Exception:
+            logger.exception("Hot tier refresh failed")
+
+
+hot_tier = HotTier(settings.hot_tier_days)
@@ -0,0 +1,124 @@
+from datetime import date
+from typing import List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+from src.core.metrics import timed
+from src.db.models import Data
+from src.db.partitions import ensure_partitions
+
+# Existing rows are never changed, so the row count and newest timestamp
+# of a range stay valid validators for /data
+ON_CONFLICT = "ON CONFLICT (timestamp) DO NOTHING"
+
+# exec_driver_sql skips SQLAlchemy's DateTime processing, so timestamps are
+# bound as text. %S on timestamp[us] writes "SS.ffffff", which is the
+# format SQLAlchemy itself stores on SQLite
+SQLITE_TIMESTAMP = "%Y-%m-%d %H:%M:%S"
+
+
+def last_per_timestamp(table: pa.Table) -> pa.Table:
+    """Drop all but the last row sent for each timestamp, sorted by time."""
+    timestamps = table.column("timestamp").to_numpy()
+    reversed_unique = np.unique(timestamps[::-1], return_index=True)[1]
+    indices = len(timestamps) - 1 - reversed_unique
+
+    return table.take(pa.array(indices))
+
+
+def copy_rows(connection: Connection, table: pa.Table) -> int:
+    """Write rows through COPY into a temporary table, then merge them."""
+    columns = ", ".join(table.column_names)
+    buffer = pa.BufferOutputStream()
+    pa_csv.write_csv(table, buffer, pa_csv.WriteOptions(include_header=False))
+
+    # The raw psycopg2 cursor, as COPY has no SQLAlchemy equivalent
+    with connection.connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE data_ingest "
+            f"(LIKE {Data.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        cursor.copy_expert(
+            f"COPY data_ingest ({columns}) FROM STDIN WITH (FORMAT csv)",
+            pa.BufferReader(buffer.getvalue()),
+        )
+        cursor.execute(
+            f"INSERT INTO {Data.__tablename__} ({columns}) "
+            f"SELECT {columns} FROM data_ingest {ON_CONFLICT}"
+        )
+        return cursor.rowcount
+
+
+def execute_rows(
+    connection: Connection, table: pa.Table, batch_size: int
+) -> int:
+    """Write rows with one executemany per batch of plain tuples."""
+    columns = ", ".join(table.column_names)
+    statement = (
+        f"INSERT INTO {Data.__tablename__} ({columns}) "
+        f"VALUES ({', '.join('?' for _ in table.column_names)}) "
+        f"{ON_CONFLICT}"
+    )
+    inserted = 0
+
+    for batch in table.to_batches(max_chunksize=batch_size):
+        # Formatted by Arrow, skipping SQLAlchemy's per-value processing
+        timestamps = pc.strftime(batch.column(0), SQLITE_TIMESTAMP)
+        rows = list(
+            zip(
+                timestamps.to_pylist(),
+                *(column.to_pylist() for column in batch.columns[1:]),
+            )
+        )
+        inserted += connection.exec_driver_sql(statement, rows).rowcount
+
+    return inserted
+
+
+def write_rows(
+    connection: Connection, table: pa.Table, batch_size: int = 10_000
+) -> int:
+    """Insert ``table`` into ``data`` and return the rows written.
+
+    Uses COPY on PostgreSQL and batched executemany elsewhere. Rows whose
+    timestamp already exists are skipped. The caller commits.
+    """
+    if not table.num_rows:
+        return 0
+
+    table = last_per_timestamp(table)
+
+    if connection.dialect.name == "postgresql":
+        return copy_rows(connection, table)
+
+    return execute_rows(connection, table, batch_size)
+
+
+def days_of(table: pa.Table) -> List[date]:
+    return pc.unique(
+        pc.cast(table.column("timestamp"), pa.date32())
+    ).to_pylist()
+
+
+def ingest(session: Session, table: pa.Table, batch_size: int) -> int:
+    """Write an uploaded table in one transaction, creating partitions."""
+    if not table.num_rows:
+        return 0
+
+    bounds = pc.min_max(table.column("timestamp"))
+    ensure_partitions(
+        session.get_bind(),
+        bounds["min"].as_py(),
+        bounds["max"].as_py(),
+    )
+
+    with timed("db-write"):
+        written = write_rows(session.connection(), table, batch_size)
+        session.commit()
+
+    return written
@@ -0,0 +1,97 @@
+"""Partition data by month
+
+Revision ID: a41c7d9e2f60
+Revises: 3b184f357999
+Create Date: 2026-10-17 15:21:08.734112
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.db.partitions import create_partition_sql, months_between
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7d9e2f60"
+down_revision: Union[str, Sequence[str], None] = "3b184f357999"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicate of the primary key index
+    op.drop_index(op.f("ix_data_timestamp"), table_name="data")
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.rename_table("data", "data_unpartitioned")
+    op.execute(
+        "ALTER TABLE data_unpartitioned "
+        "RENAME CONSTRAINT data_pkey TO data_unpartitioned_pkey"
+    )
+    op.create_table(
+        "data",
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("wind_speed", sa.Float(), nullable=False),
+        sa.Column("power", sa.Float(), nullable=False),
+        sa.Column("ambient_temperature", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("timestamp"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    op.create_index(
+        "ix_data_timestamp_brin",
+        "data",
+        ["timestamp"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+    first, last = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT min(timestamp), max(timestamp) "
+                "FROM data_unpartitioned"
+            )
+        )
+        .one()
+    )
+    if first is not None:
+        for month in months_between(first, last):
+            op.execute(create_partition_sql(month))
+
+    op.execute("INSERT INTO data SELECT * FROM data_unpartitioned")
+    op.drop_table("data_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index(
+            op.f("ix_data_timestamp"), "data", ["timestamp"], unique=False
+        )
+        return
+
+    op.rename_table("data", "data_partitioned")
+    op.create_table(
+        "data",
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("wind_speed", sa.Float(), nullable=False),
+        sa.Column("power", sa.Float(), nullable=False),
+        sa.Column("ambient_temperature", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("timestamp", name="data_unpartitioned_pkey"),
+    )
+    op.execute("INSERT INTO data SELECT * FROM data_partitioned")
+    # Dropping the parent drops every partition with it
+    op.drop_table("data_partitioned")
+    op.execute(
+        "ALTER TABLE data RENAME CONSTRAINT data_unpartitioned_pkey "
+        "TO data_pkey"
+    )
+    op.create_index(
+        op.f("ix_data_timestamp"), "data", ["timestamp"], unique=False
+    )
@@ -1,10 +1,21 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class Data(SQLModel, table=True):
-    timestamp: datetime = Field(primary_key=True, index=True)
+    # Monthly range partitions on PostgreSQL, created on demand by
+    # src.db.partitions. The primary key already serves range scans, and
+    # the BRIN index is what is left of the old B-tree on timestamp.
+    __table_args__ = (
+        Index(
+            "ix_data_timestamp_brin", "timestamp", postgresql_using="brin"
+        ).ddl_if(dialect="postgresql"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+    timestamp: datetime = Field(primary_key=True)
     wind_speed: float
     power: float
     ambient_temperature: float
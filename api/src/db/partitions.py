@@ -0,0 +1,78 @@
+import threading
+from datetime import date, datetime
+from typing import List, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Months whose partition is known to exist, per database URL
+_known: Set[tuple] = set()
+_lock = threading.Lock()
+
+
+def month_start(moment: datetime) -> date:
+    return date(moment.year, moment.month, 1)
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def months_between(start: datetime, end: datetime) -> List[date]:
+    """First day of every month overlapping ``[start, end]``."""
+    months = [month_start(start)]
+
+    while next_month(months[-1]) <= end.date():
+        months.append(next_month(months[-1]))
+
+    return months
+
+
+def partition_name(month: date) -> str:
+    return f"data_y{month.year}m{month.month:02d}"
+
+
+def create_partition_sql(month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+        f"PARTITION OF data FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{next_month(month).isoformat()}')"
+    )
+
+
+def ensure_partitions(engine: Engine, start: datetime, end: datetime):
+    """Create the monthly ``data`` partitions ``[start, end]`` falls in.
+
+    Runs in its own transaction, so the partitions exist before the
+    caller inserts. A no-op on databases without declarative
+    partitioning (SQLite) and on a ``data`` table not partitioned yet.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    url = engine.url.render_as_string(hide_password=True)
+    months = [
+        month
+        for month in months_between(start, end)
+        if (url, month) not in _known
+    ]
+
+    if not months:
+        return
+
+    with engine.begin() as connection:
+        partitioned = connection.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('data')"
+            )
+        ).first()
+
+        if partitioned is None:
+            return
+
+        for month in months:
+            connection.execute(text(create_partition_sql(month)))
+
+    with _lock:
+        _known.update((url, month) for month in months)
@@ -0,0 +1,140 @@
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from sqlalchemy import BigInteger, Integer, cast, func, literal_column
+from sqlmodel import select
+
+from src.db.models import Data
+
+PARTIALS = ["count", "sum", "sumsq", "min", "max"]
+
+UNITS = {"s": 1, "min": 60, "h": 3600, "d": 86400}
+
+Partials = Dict[str, np.ndarray]
+
+STATISTICS: Dict[str, Callable[[Partials], np.ndarray]] = {
+    "count": lambda p: p["count"],
+    "sum": lambda p: p["sum"],
+    "mean": lambda p: p["sum"] / p["count"],
+    "min": lambda p: p["min"],
+    "max": lambda p: p["max"],
+    "std": lambda p: np.where(
+        p["count"] > 1,
+        np.sqrt(
+            np.clip(p["sumsq"] - p["sum"] * p["sum"] / p["count"], 0, None)
+            / (p["count"] - 1)
+        ),
+        np.nan,
+    ),
+}
+
+
+def parse_interval(interval: str) -> int:
+    """Bucket width in seconds from strings like ``30s``, ``10min``, ``1h``."""
+    match = re.fullmatch(r"(\d+)(s|min|h|d)", interval.strip())
+
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(
+            "interval must be a positive integer followed by s, min, h or d"
+        )
+
+    return int(match.group(1)) * UNITS[match.group(2)]
+
+
+def bucket_expression(dialect: str, seconds: int):
+    """Epoch-aligned bucket number of ``Data.timestamp``."""
+    width = literal_column(str(int(seconds)), Integer)
+
+    if dialect == "sqlite":
+        return cast(func.strftime("%s", Data.timestamp), Integer) // width
+
+    return cast(
+        func.floor(func.extract("epoch", Data.timestamp) / width), BigInteger
+    )
+
+
+def resample_statement(
+    dialect: str,
+    start: datetime,
+    end: datetime,
+    seconds: int,
+    fields: List[str],
+):
+    """Per-bucket count/sum/sum of squares/min/max of each field."""
+    bucket = bucket_expression(dialect, seconds)
+
+    columns = []
+    for field in fields:
+        column = getattr(Data, field)
+        columns += [
+            func.count(column),
+            func.sum(column),
+            func.sum(column * column),
+            func.min(column),
+            func.max(column),
+        ]
+
+    return (
+        select(bucket, *columns)
+        .where(
+            Data.timestamp >= start,
+            Data.timestamp <= end,
+        )
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+
+
+def finalize(
+    rows: List[tuple],
+    seconds: int,
+    fields: List[str],
+    aggregations: List[str],
+) -> Tuple[List[str], List[tuple]]:
+    """Turn partial rows into ``<field>_<aggregation>`` rows.
+
+    Empty buckets between the first and the last one are kept with null
+    values, like ``DataFrame.resample`` does.
+    """
+    keys = ["timestamp"] + [
+        f"{field}_{aggregation}"
+        for field in fields
+        for aggregation in aggregations
+    ]
+
+    if not rows:
+        return keys, []
+
+    table = np.array(rows, dtype=np.float64)
+    buckets = table[:, 0].astype(np.int64)
+    slots = buckets - buckets[0]
+    size = int(slots[-1]) + 1
+
+    timestamps = (
+        ((buckets[0] + np.arange(size)) * seconds)
+        .astype("datetime64[s]")
+        .astype("datetime64[us]")
+        .tolist()
+    )
+
+    columns = []
+    for position, field in enumerate(fields):
+        partials = {}
+        for offset, name in enumerate(PARTIALS):
+            values = np.full(size, np.nan if name in ("min", "max") else 0.0)
+            values[slots] = table[:, 1 + position * len(PARTIALS) + offset]
+            partials[name] = values
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            columns += [
+                STATISTICS[aggregation](partials)
+                for aggregation in aggregations
+            ]
+
+    values = np.column_stack(columns).tolist()
+
+    return keys, [
+        (timestamp, *row) for timestamp, row in zip(timestamps, values)
+    ]
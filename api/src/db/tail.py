@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Callable, List, Optional, Set
+
+from sqlmodel import Session, func, select
+
+from src.core import settings
+from src.db import engine, run_db
+from src.db.models import Data
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ["wind_speed", "power", "ambient_temperature"]
+
+
+class TailBroadcaster:
+    """Fan new ``data`` rows out to every subscriber of this process.
+
+    A single poller task reads rows newer than ``cursor`` every
+    ``interval`` seconds, or as soon as :meth:`notify` is called, and
+    puts each batch on the queue of every subscriber. The database sees
+    one query per interval however many clients are listening. The
+    poller runs only while there are subscribers. A subscriber whose
+    queue is full is dropped and its stream ends, so a slow client never
+    holds rows back from the others.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        queue_size: int = 100,
+        batch_size: int = 10_000,
+        session_factory: Callable[[], Session] = lambda: Session(engine),
+    ):
+        self.interval = interval
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.cursor: Optional[datetime] = None
+        self.polls = 0
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def _latest(self) -> Optional[datetime]:
+        with self.session_factory() as session:
+            return session.exec(select(func.max(Data.timestamp))).one()
+
+    def _fetch(self, cursor: Optional[datetime]) -> List[tuple]:
+        statement = select(
+            Data.timestamp, *(getattr(Data, field) for field in FIELDS)
+        )
+        if cursor is not None:
+            statement = statement.where(Data.timestamp > cursor)
+
+        with self.session_factory() as session:
+            return session.exec(
+                statement.order_by(Data.timestamp).limit(self.batch_size)
+            ).all()
+
+    def notify(self):
+        """Poll now instead of at the end of the interval."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def dropped(self, queue: asyncio.Queue) -> bool:
+        return queue not in self._subscribers
+
+    async def _poll(self):
+        while self._subscribers:
+            self._wake.clear()
+            rows = []
+            try:
+                rows = await run_db(self._fetch, self.cursor)
+                self.polls += 1
+            except Exception:
+                logger.exception("Tail poll failed")
+
+            if rows:
+                self.cursor = rows[-1][0]
+                for queue in list(self._subscribers):
+                    try:
+                        queue.put_nowait(rows)
+                    except asyncio.QueueFull:
+                        self._subscribers.discard(queue)
+                        logger.warning(
+                            "Dropped a tail subscriber lagging behind"
+                        )
+
+            # A full batch means more rows are waiting
+            if len(rows) < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        self._task = None
+
+    @asynccontextmanager
+    async def subscribe(self):
+        """Yield a queue of new row batches and the cursor it starts at.
+
+        Every row after the cursor is put on the queue, so a caller
+        replaying rows up to the cursor sees each row exactly once.
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        if self._task is None or self._task.done():
+            latest = await run_db(self._latest)
+            # Another subscriber may have started the poller meanwhile
+            if self._task is None or self._task.done():
+                self.cursor = latest
+                self._wake = asyncio.Event()
+                self._task = asyncio.create_task(self._poll())
+
+        self._subscribers.add(queue)
+        try:
+            yield queue, self.cursor
+        finally:
+            self._subscribers.discard(queue)
+
+
+tail = TailBroadcaster(settings.tail_poll_seconds)
@@ -1,15 +1,54 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlmodel import Session
+
+from src.core import settings
+from src.core.metrics import MetricsMiddleware
+from src.db import engine, run_db
+from src.db.hot_tier import hot_tier, keep_fresh
 from src.routes.data import router as data_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not hot_tier.enabled:
+        yield
+        return
+
+    with Session(engine) as session:
+        await run_db(hot_tier.refresh, session)
+    refresher = asyncio.create_task(
+        keep_fresh(hot_tier, settings.hot_tier_refresh_seconds)
+    )
+
+    yield
+
+    refresher.cancel()
+
+
 app = FastAPI(
     title="Source Data API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Responses that already carry a Content-Encoding are left untouched
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
+# Outermost, so latency and bytes cover compression too
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(data_router)
 
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
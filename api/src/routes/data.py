@@ -1,25 +1,116 @@
+import asyncio
+import time
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import (
+    AsyncIterator,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    get_args,
+)
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+import orjson
+import pyarrow.compute as pc
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlmodel import Field, Session, SQLModel, func, select
 
-from src.db import get_session
+from src.core import settings
+from src.core.cache import day_cache
+from src.core.conditional import (
+    compress,
+    is_conditional,
+    is_not_modified,
+    make_etag,
+    validator_headers,
+)
+from src.core.downsampling import downsample
+from src.core.encoding import (
+    ARROW,
+    CSV,
+    DECODERS,
+    ENCODERS,
+    JSON,
+    NDJSON,
+    PARQUET,
+    decode_table,
+    encode_ndjson,
+    negotiate,
+)
+from src.core.metrics import record_rows, timed
+from src.db import fetch_all, get_session, run_db
+from src.db.batch import batch_statement, group_rows
+from src.db.hot_tier import hot_tier
+from src.db.ingest import days_of, ingest
 from src.db.models import Data
+from src.db.resample import (
+    STATISTICS,
+    finalize,
+    parse_interval,
+    resample_statement,
+)
+from src.db.tail import FIELDS, TailBroadcaster, tail
 
 router = APIRouter(prefix="/data", tags=["data"])
 
+Variable = Literal["wind_speed", "power", "ambient_temperature"]
+VARIABLES = list(get_args(Variable))
 
-@router.get("", response_model=List[Data])
+
+class BatchWindow(SQLModel):
+    start: datetime
+    end: datetime
+    variables: Optional[List[Variable]] = Field(
+        None,
+        description="Variables to include for this window (default: all)",
+    )
+
+
+def stream_ndjson(
+    session: Session, statement, keys: List[str]
+) -> Iterator[bytes]:
+    """Encode rows as NDJSON, reading them in chunks from the cursor."""
+    result = session.exec(
+        statement.execution_options(yield_per=settings.stream_chunk_size)
+    )
+
+    for rows in result.partitions():
+        record_rows(len(rows))
+        with timed("serialize"):
+            chunk = encode_ndjson(keys, rows)
+        yield chunk
+
+
+@router.get(
+    "",
+    response_model=List[Data],
+    responses={
+        200: {
+            "content": {NDJSON: {}, ARROW: {}, PARQUET: {}},
+            "description": (
+                "JSON array by default; NDJSON, Arrow IPC stream or "
+                "Parquet when requested through the Accept header"
+            ),
+        }
+    },
+)
 async def get_data(
+    request: Request,
     start: datetime = Query(..., description="Start datetime (ISO 8601)"),
     end: datetime = Query(..., description="End datetime (ISO 8601)"),
-    variables: Optional[
-        List[Literal["wind_speed", "power", "ambient_temperature"]]
-    ] = Query(
+    variables: Optional[List[Variable]] = Query(
         None,
         description="Variables to include in the response (default: all)",
     ),
+    max_points: Optional[int] = Query(
+        None,
+        ge=2,
+        description=(
+            "Upper bound on returned rows; longer ranges are reduced to the "
+            "minimum and maximum of each variable per time bucket"
+        ),
+    ),
     session: Session = Depends(get_session),
 ):
     if start >= end:
@@ -28,8 +119,23 @@ async def get_data(
             detail="start must be earlier than end",
         )
 
+    fields = [
+        variable
+        for variable in VARIABLES
+        if variables is None or variable in variables
+    ]
+    keys = ["timestamp", *fields]
+
+    if max_points is not None and max_points < 2 * len(fields):
+        raise HTTPException(
+            status_code=422,
+            detail="max_points must be at least 2 per requested variable",
+        )
+
+    # Only the requested columns, fetched as plain tuples
+    columns = [getattr(Data, key) for key in keys]
     statement = (
-        select(Data)
+        select(*columns)
         .where(
             Data.timestamp >= start,
             Data.timestamp <= end,
@@ -37,28 +143,470 @@ async def get_data(
         .order_by(Data.timestamp)
     )
 
-    results = session.exec(statement).all()
+    media_type = negotiate(request.headers.get("accept", ""))
+
+    # Ranges inside the in-memory tier never reach the database
+    rows = None
+    if hot_tier.enabled:
+        with timed("hot-tier"):
+            rows = hot_tier.read(start, end, fields)
+
+    def range_etag(count: int, latest: Optional[datetime]) -> str:
+        # Rows are only ever inserted, so these change with the range
+        return make_etag(
+            start, end, *keys, max_points, media_type, count, latest
+        )
+
+    etag = None
+    headers = {"Vary": "Accept"}
+
+    if is_conditional(request):
+        if rows is not None:
+            count, latest = len(rows), rows[-1][0] if rows else None
+        else:
+            # Cheap validators of the range, checked before reading rows
+            validators = select(func.count(), func.max(Data.timestamp)).where(
+                Data.timestamp >= start, Data.timestamp <= end
+            )
+            with timed("validate"):
+                count, latest = await run_db(
+                    lambda: session.exec(validators).one()
+                )
+        etag = range_etag(count, latest)
+        headers = validator_headers(etag)
+
+        if is_not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+
+    if rows is None and media_type == NDJSON and max_points is None:
+        # Compressed by GZipMiddleware, as the body size is unknown here.
+        # Without a conditional request there is no ETag for it either.
+        return StreamingResponse(
+            stream_ndjson(session, statement, keys),
+            media_type=NDJSON,
+            headers=headers,
+        )
+
+    if rows is None and day_cache.enabled:
+
+        def fetch_days(lower: datetime, upper: datetime):
+            return fetch_all(
+                session,
+                select(*columns)
+                .where(Data.timestamp >= lower, Data.timestamp < upper)
+                .order_by(Data.timestamp),
+            )
+
+        rows = await run_db(day_cache.read, start, end, fields, fetch_days)
+    elif rows is None:
+        rows = await run_db(fetch_all, session, statement)
+
+    if etag is None:
+        headers = validator_headers(
+            range_etag(len(rows), rows[-1][0] if rows else None)
+        )
+
+    if max_points is not None:
+        with timed("downsample"):
+            rows = downsample(rows, max_points)
+    record_rows(len(rows))
+
+    # Serialized directly, skipping per-row validation of response_model
+    with timed("serialize"):
+        content = ENCODERS[media_type](keys, rows)
+    with timed("compress"):
+        content, encoding = compress(
+            content, request.headers.get("accept-encoding", "")
+        )
+    headers["Vary"] = "Accept, Accept-Encoding"
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+def stream_batch_ndjson(
+    session: Session,
+    statement,
+    fields: List[str],
+    projections: List[List[str]],
+) -> Iterator[bytes]:
+    """One NDJSON line per row, tagged with the index of its window."""
+    positions = {field: offset for offset, field in enumerate(fields, 2)}
+    result = session.exec(
+        statement.execution_options(yield_per=settings.stream_chunk_size)
+    )
+
+    for rows in result.partitions():
+        record_rows(len(rows))
+        with timed("serialize"):
+            chunk = b"".join(
+                orjson.dumps(
+                    {
+                        "window": row[0],
+                        "timestamp": row[1],
+                        **{
+                            field: row[positions[field]]
+                            for field in projections[row[0]]
+                        },
+                    },
+                    option=orjson.OPT_APPEND_NEWLINE,
+                )
+                for row in rows
+            )
+        yield chunk
+
+
+@router.post(
+    "/batch",
+    responses={
+        200: {
+            "content": {NDJSON: {}},
+            "description": (
+                "JSON array with one `{start, end, variables, data}` object "
+                "per window, in request order; with `Accept: "
+                "application/x-ndjson`, one row per line tagged with the "
+                "index of its window, streamed as it is read"
+            ),
+        }
+    },
+)
+async def batch_data(
+    request: Request,
+    windows: List[BatchWindow] = Body(..., embed=True, min_length=1),
+    session: Session = Depends(get_session),
+):
+    if len(windows) > settings.batch_max_windows:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"At most {settings.batch_max_windows} windows per request"
+            ),
+        )
+
+    if any(window.start >= window.end for window in windows):
+        raise HTTPException(
+            status_code=400,
+            detail="start must be earlier than end in every window",
+        )
+
+    projections = [
+        [
+            variable
+            for variable in VARIABLES
+            if window.variables is None or variable in window.variables
+        ]
+        for window in windows
+    ]
+    # Columns any window asks for, projected per window afterwards
+    fields = [
+        variable
+        for variable in VARIABLES
+        if any(variable in projection for projection in projections)
+    ]
+
+    statement = batch_statement(
+        session.get_bind().dialect.name,
+        [(window.start, window.end) for window in windows],
+        fields,
+    )
+
+    if negotiate(request.headers.get("accept", "")) == NDJSON:
+        return StreamingResponse(
+            stream_batch_ndjson(session, statement, fields, projections),
+            media_type=NDJSON,
+        )
+
+    rows = await run_db(fetch_all, session, statement)
+    grouped = group_rows(rows, len(windows), fields, projections)
+    record_rows(len(rows))
+
+    with timed("serialize"):
+        content = orjson.dumps(
+            [
+                {
+                    "start": window.start,
+                    "end": window.end,
+                    "variables": projection,
+                    "data": [
+                        dict(zip(["timestamp", *projection], row))
+                        for row in window_rows
+                    ],
+                }
+                for window, projection, window_rows in zip(
+                    windows, projections, grouped
+                )
+            ]
+        )
+    with timed("compress"):
+        content, encoding = compress(
+            content, request.headers.get("accept-encoding", "")
+        )
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=content, media_type=JSON, headers=headers)
+
+
+@router.post(
+    "/ingest",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON: {}, CSV: {}, ARROW: {}},
+        }
+    },
+)
+async def ingest_data(
+    request: Request, session: Session = Depends(get_session)
+):
+    """Write a batch of rows sent as NDJSON, CSV or an Arrow IPC stream.
+
+    Every row needs a timestamp and all variables. Rows whose timestamp
+    already exists are skipped; within a batch the last row sent for a
+    timestamp wins.
+    """
+    started = time.perf_counter()
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if media_type not in DECODERS:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Content-Type must be one of {', '.join(DECODERS)}",
+        )
+
+    body = await request.body()
+    try:
+        with timed("decode"):
+            table = decode_table(media_type, ["timestamp", *VARIABLES], body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    written = await run_db(ingest, session, table, settings.ingest_batch_size)
+
+    if written:
+        tail.notify()
+        day_cache.invalidate(days_of(table))
+        # Rows added inside the tier are only seen by a full reload
+        earliest = pc.min(table.column("timestamp")).as_py()
+        if hot_tier.latest is not None and earliest <= hot_tier.latest:
+            hot_tier.clear()
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        "received": table.num_rows,
+        "written": written,
+        "seconds": round(elapsed, 4),
+        "rows_per_s": round(table.num_rows / elapsed),
+    }
+
+
+def encode_events(keys: List[str], rows: List[tuple]) -> bytes:
+    """One Server-Sent Event per row, identified by its timestamp."""
+    return b"".join(
+        b"id: "
+        + row[0].isoformat().encode()
+        + b"\ndata: "
+        + orjson.dumps(dict(zip(keys, row)))
+        + b"\n\n"
+        for row in rows
+    )
+
+
+async def tail_events(
+    since: Optional[datetime],
+    fields: List[str],
+    broadcaster: TailBroadcaster,
+) -> AsyncIterator[bytes]:
+    """Replay rows after ``since``, then follow the shared poller.
+
+    Each replay page is read in a session of its own, so no connection is
+    held for the lifetime of the stream.
+    """
+    keys = ["timestamp", *fields]
+    offsets = [1 + FIELDS.index(field) for field in fields]
+
+    def fetch_page(statement) -> List[tuple]:
+        with broadcaster.session_factory() as session:
+            return fetch_all(session, statement)
 
-    response = []
+    async with broadcaster.subscribe() as (queue, cursor):
+        last = since
 
-    include_wind_speed = variables is None or "wind_speed" in variables
-    include_power = variables is None or "power" in variables
-    include_ambient_temperature = (
-        variables is None or "ambient_temperature" in variables
+        # Keyset pages up to the cursor; later rows arrive on the queue
+        while last is not None and (cursor is None or last < cursor):
+            statement = select(*(getattr(Data, key) for key in keys)).where(
+                Data.timestamp > last
+            )
+            if cursor is not None:
+                statement = statement.where(Data.timestamp <= cursor)
+            rows = await run_db(
+                fetch_page,
+                statement.order_by(Data.timestamp).limit(
+                    settings.stream_chunk_size
+                ),
+            )
+            if rows:
+                record_rows(len(rows))
+                yield encode_events(keys, rows)
+                last = rows[-1][0]
+            if len(rows) < settings.stream_chunk_size:
+                break
+
+        while not (queue.empty() and broadcaster.dropped(queue)):
+            try:
+                batch = await asyncio.wait_for(
+                    queue.get(), settings.tail_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                # Comment line, keeping proxies from closing an idle stream
+                yield b": keep-alive\n\n"
+                continue
+
+            rows = [
+                (row[0], *(row[offset] for offset in offsets))
+                for row in batch
+                if last is None or row[0] > last
+            ]
+            if rows:
+                record_rows(len(rows))
+                yield encode_events(keys, rows)
+                last = rows[-1][0]
+
+
+@router.get(
+    "/stream",
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": (
+                "Server-Sent Events, one per row with the row as JSON data "
+                "and its timestamp as the event id"
+            ),
+        }
+    },
+)
+async def stream_data(
+    request: Request,
+    since: Optional[datetime] = Query(
+        None,
+        description=(
+            "Replay rows after this datetime before following new ones "
+            "(default: only new rows)"
+        ),
+    ),
+    variables: Optional[List[Variable]] = Query(
+        None,
+        description="Variables to include in the events (default: all)",
+    ),
+):
+    """Follow new source rows as they are written.
+
+    Reconnecting clients resume after the ``Last-Event-ID`` they send.
+    Only rows newer than the latest one seen are followed, so rows
+    backfilled into the past are not pushed.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id:
+        try:
+            since = datetime.fromisoformat(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail="Last-Event-ID must be a datetime"
+            )
+
+    fields = [
+        variable
+        for variable in VARIABLES
+        if variables is None or variable in variables
+    ]
+
+    return StreamingResponse(
+        tail_events(since, fields, tail),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    for row in results:
-        item = {"timestamp": row.timestamp}
 
-        if include_wind_speed:
-            item["wind_speed"] = row.wind_speed
+@router.get("/cache")
+def cache_stats():
+    """Hit/miss counters of this worker and size of the shared block cache."""
+    return day_cache.stats()
+
 
-        if include_power:
-            item["power"] = row.power
+@router.get(
+    "/resample",
+    responses={
+        200: {
+            "content": {NDJSON: {}, ARROW: {}, PARQUET: {}},
+            "description": (
+                "One row per interval with `<variable>_<aggregation>` "
+                "columns, the shape produced by the ETL aggregation"
+            ),
+        }
+    },
+)
+async def resample_data(
+    request: Request,
+    start: datetime = Query(..., description="Start datetime (ISO 8601)"),
+    end: datetime = Query(..., description="End datetime (ISO 8601)"),
+    interval: str = Query(
+        "10min",
+        description="Bucket width, e.g. 30s, 10min, 1h or 1d",
+    ),
+    aggs: List[str] = Query(
+        ["mean", "min", "max", "std"],
+        description=(
+            "Aggregations, repeated or comma-separated "
+            f"({', '.join(STATISTICS)})"
+        ),
+    ),
+    variables: Optional[List[Variable]] = Query(
+        None,
+        description="Variables to include in the response (default: all)",
+    ),
+    session: Session = Depends(get_session),
+):
+    if start >= end:
+        raise HTTPException(
+            status_code=400,
+            detail="start must be earlier than end",
+        )
+
+    try:
+        seconds = parse_interval(interval)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    aggregations = [agg for value in aggs for agg in value.split(",") if agg]
+    unknown = [agg for agg in aggregations if agg not in STATISTICS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown aggregations: {', '.join(unknown)}",
+        )
+
+    fields = [
+        variable
+        for variable in VARIABLES
+        if variables is None or variable in variables
+    ]
+
+    # Partials are grouped by time bucket inside the database
+    statement = resample_statement(
+        session.get_bind().dialect.name, start, end, seconds, fields
+    )
+    rows = await run_db(fetch_all, session, statement)
+    with timed("finalize"):
+        keys, rows = finalize(rows, seconds, fields, aggregations)
+    record_rows(len(rows))
 
-        if include_ambient_temperature:
-            item["ambient_temperature"] = row.ambient_temperature
+    media_type = negotiate(request.headers.get("accept", ""))
 
-        response.append(item)
+    with timed("serialize"):
+        content = ENCODERS[media_type](keys, rows)
 
-    return response
+    return Response(content=content, media_type=media_type)
@@ -0,0 +1,113 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from src.core.cache import DayBlockCache
+
+
+@pytest.fixture
+def source():
+    """Two days of 1-minute rows and a fetch function recording its calls."""
+    start = datetime(2025, 1, 1)
+    rows = [
+        (start + timedelta(minutes=minute), float(minute))
+        for minute in range(2 * 24 * 60)
+    ]
+    calls = []
+
+    def fetch(lower: datetime, upper: datetime):
+        calls.append((lower, upper))
+        return [row for row in rows if lower <= row[0] < upper]
+
+    return rows, fetch, calls
+
+
+class TestDayBlockCache:
+    def test_overlapping_ranges_reuse_blocks(self, tmp_path, source):
+        rows, fetch, calls = source
+        cache = DayBlockCache(str(tmp_path), max_bytes=10**7)
+
+        first = cache.read(
+            datetime(2025, 1, 1, 12),
+            datetime(2025, 1, 2, 12),
+            ["power"],
+            fetch,
+        )
+        second = cache.read(
+            datetime(2025, 1, 1, 18), datetime(2025, 1, 2, 6), ["power"], fetch
+        )
+
+        assert first == [
+            row
+            for row in rows
+            if datetime(2025, 1, 1, 12) <= row[0] <= datetime(2025, 1, 2, 12)
+        ]
+        assert second[0] == (datetime(2025, 1, 1, 18), 1080.0)
+        assert second[-1] == (datetime(2025, 1, 2, 6), 1800.0)
+        assert calls == [(datetime(2025, 1, 1), datetime(2025, 1, 3))]
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["blocks"] == 2
+
+    def test_shared_between_instances(self, tmp_path, source):
+        _, fetch, calls = source
+        span = (datetime(2025, 1, 1), datetime(2025, 1, 1, 23, 59))
+
+        DayBlockCache(str(tmp_path), 10**7).read(*span, ["power"], fetch)
+        other = DayBlockCache(str(tmp_path), 10**7)
+        other.read(*span, ["power"], fetch)
+
+        assert len(calls) == 1
+        assert other.hits == 1
+
+    def test_invalidate(self, tmp_path, source):
+        _, fetch, calls = source
+        cache = DayBlockCache(str(tmp_path), max_bytes=10**7)
+        span = (datetime(2025, 1, 1), datetime(2025, 1, 1, 23, 59))
+
+        cache.read(*span, ["power"], fetch)
+        cache.invalidate([date(2025, 1, 1)])
+        cache.read(*span, ["power"], fetch)
+
+        assert len(calls) == 2
+
+    def test_lru_eviction(self, tmp_path, source):
+        _, fetch, _ = source
+        cache = DayBlockCache(str(tmp_path), max_bytes=10**7)
+        cache.read(
+            datetime(2025, 1, 1), datetime(2025, 1, 1, 1), ["power"], fetch
+        )
+        block = cache.stats()["bytes"]
+        cache.max_bytes = block
+
+        cache.read(
+            datetime(2025, 1, 2), datetime(2025, 1, 2, 1), ["power"], fetch
+        )
+
+        assert [path.name for path in tmp_path.glob("*.arrow")] == [
+            "2025-01-02_power.arrow"
+        ]
+
+    def test_invalidated_during_fetch_not_stored(self, tmp_path, source):
+        _, fetch, calls = source
+        cache = DayBlockCache(str(tmp_path), max_bytes=10**7)
+        span = (datetime(2025, 1, 1), datetime(2025, 1, 1, 23, 59))
+
+        def racing_fetch(lower: datetime, upper: datetime):
+            rows = fetch(lower, upper)
+            cache.invalidate([date(2025, 1, 1)])
+            return rows
+
+        cache.read(*span, ["power"], racing_fetch)
+        cache.read(*span, ["power"], fetch)
+
+        assert cache.stats()["blocks"] == 1
+        assert len(calls) == 2
+
+    def test_current_day_not_cached(self, tmp_path):
+        cache = DayBlockCache(str(tmp_path), max_bytes=10**7)
+        today = datetime.combine(datetime.now(timezone.utc).date(), time())
+
+        cache.read(today, today + timedelta(hours=1), ["power"], lambda *_: [])
+
+        assert cache.stats()["blocks"] == 0
@@ -0,0 +1,17 @@
+import numpy as np
+
+from src.core.downsampling import minmax_indices
+
+
+class TestMinmaxIndices:
+    def test_long_range_does_not_overflow(self):
+        # A century in microseconds times 50 000 buckets exceeds int64
+        timestamps = np.linspace(0, 100 * 365 * 86400 * 10**6, 200_000)
+        values = np.sin(np.arange(200_000, dtype=np.float64))[:, None]
+
+        indices = minmax_indices(timestamps.astype(np.int64), values, 100_000)
+
+        assert 0 < len(indices) <= 100_000
+        assert values[indices].max() == values.max()
+        assert values[indices].min() == values.min()
+        assert np.all(np.diff(indices) > 0)
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.db.hot_tier import HotTier
+from src.db.models import Data
+
+
+def add_rows(session, start: datetime, minutes: int):
+    session.add_all(
+        Data(
+            timestamp=start + timedelta(minutes=minute),
+            wind_speed=1.0,
+            power=float(minute),
+            ambient_temperature=25.0,
+        )
+        for minute in range(minutes)
+    )
+    session.commit()
+
+
+@pytest.fixture
+def tier(session):
+    add_rows(session, datetime(2025, 1, 1), 3 * 24 * 60)
+    tier = HotTier(days=1)
+    tier.refresh(session)
+    return tier
+
+
+class TestHotTier:
+    def test_loads_latest_days(self, tier):
+        assert len(tier) == 24 * 60 + 1
+        assert tier.latest == datetime(2025, 1, 3, 23, 59)
+        assert (
+            tier.read(datetime(2025, 1, 1), datetime(2025, 1, 2), ["power"])
+            is None
+        )
+
+    def test_read_matches_range(self, tier):
+        rows = tier.read(
+            datetime(2025, 1, 3, 12, 0, 30),
+            datetime(2025, 1, 3, 12, 2),
+            ["power", "wind_speed"],
+        )
+
+        assert rows == [
+            (datetime(2025, 1, 3, 12, 1), 3601.0, 1.0),
+            (datetime(2025, 1, 3, 12, 2), 3602.0, 1.0),
+        ]
+
+    def test_refresh_appends_and_evicts(self, tier, session):
+        snapshot = tier.read(
+            datetime(2025, 1, 3), datetime(2025, 1, 3, 0, 1), ["power"]
+        )
+        add_rows(session, datetime(2025, 1, 4), 2000)
+
+        tier.refresh(session)
+
+        assert tier.latest == datetime(2025, 1, 4) + timedelta(minutes=1999)
+        assert len(tier) == 24 * 60 + 1
+        assert (
+            tier.read(datetime(2025, 1, 3), datetime(2025, 1, 4), []) is None
+        )
+        assert snapshot == [
+            (datetime(2025, 1, 3, 0, 0), 2880.0),
+            (datetime(2025, 1, 3, 0, 1), 2881.0),
+        ]
+
+    def test_reloads_after_backfill(self, tier, session):
+        session.get(Data, datetime(2025, 1, 3, 6)).power = -1.0
+        session.delete(session.get(Data, datetime(2025, 1, 3, 7)))
+        session.commit()
+
+        tier.refresh(session)
+
+        # A different row count inside the tier triggers a full reload
+        rows = tier.read(
+            datetime(2025, 1, 3, 6), datetime(2025, 1, 3, 7), ["power"]
+        )
+        assert len(rows) == 60
+        assert rows[0] == (datetime(2025, 1, 3, 6), -1.0)
+
+    def test_clear_during_refresh_wins(self, tier, session, monkeypatch):
+        add_rows(session, datetime(2025, 1, 4), 10)
+        arrays = tier._arrays
+
+        def racing_arrays(rows):
+            tier.clear()
+            return arrays(rows)
+
+        monkeypatch.setattr(tier, "_arrays", racing_arrays)
+        tier.refresh(session)
+
+        # Rows read before the clear are not installed over it
+        assert len(tier) == 0
+        assert (
+            tier.read(datetime(2025, 1, 4), datetime(2025, 1, 5), []) is None
+        )
+
+        monkeypatch.undo()
+        tier.refresh(session)
+
+        assert tier.latest == datetime(2025, 1, 4, 0, 9)
@@ -0,0 +1,40 @@
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+
+from src.db.partitions import (
+    create_partition_sql,
+    ensure_partitions,
+    months_between,
+)
+
+
+class TestPartitions:
+    def test_months_between_crosses_year(self):
+        months = months_between(
+            datetime(2024, 11, 15, 12), datetime(2025, 2, 1, 0, 0)
+        )
+
+        assert months == [
+            date(2024, 11, 1),
+            date(2024, 12, 1),
+            date(2025, 1, 1),
+            date(2025, 2, 1),
+        ]
+
+    def test_create_partition_sql(self):
+        assert create_partition_sql(date(2024, 12, 1)) == (
+            "CREATE TABLE IF NOT EXISTS data_y2024m12 PARTITION OF data "
+            "FOR VALUES FROM ('2024-12-01') TO ('2025-01-01')"
+        )
+
+    def test_ensure_partitions_skips_sqlite(self):
+        engine = create_engine("sqlite://")
+
+        ensure_partitions(engine, datetime(2025, 1, 1), datetime(2025, 3, 1))
+
+        with engine.connect() as connection:
+            tables = connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master"
+            ).all()
+        assert tables == []
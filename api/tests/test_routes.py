@@ -1,8 +1,23 @@
-from datetime import datetime
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
+import httpx
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlmodel import delete, select
 
+from src.core.cache import DayBlockCache
+from src.db import get_session
+from src.db.hot_tier import HotTier
 from src.db.models import Data
+from src.main import app
 
 
 class TestRoutes:
@@ -52,3 +67,564 @@ class TestRoutes:
         assert data[0]["wind_speed"] == 5.0
         assert data[0]["timestamp"] == "2025-01-02T00:00:00"
         assert len(data) == 1
+
+    def test_stream_ndjson(self, client: TestClient, mixer):
+        for minute in range(3):
+            mixer.blend(
+                Data,
+                timestamp=datetime(2025, 1, 2, 0, minute, 0),
+                wind_speed=float(minute),
+            )
+        response = client.get(
+            "/data",
+            params={
+                "start": "2025-01-02T00:00:00",
+                "end": "2025-01-02T00:10:00",
+                "variables": ["wind_speed"],
+            },
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [
+            {
+                "timestamp": (
+                    datetime(2025, 1, 2) + timedelta(minutes=minute)
+                ).isoformat(),
+                "wind_speed": float(minute),
+            }
+            for minute in range(3)
+        ]
+
+    def test_default_returns_all_variables(self, client: TestClient, mixer):
+        mixer.blend(
+            Data,
+            timestamp=datetime(2025, 1, 2, 0, 0, 0),
+            wind_speed=5.0,
+            power=100.0,
+            ambient_temperature=25.0,
+        )
+        response = client.get(
+            "/data",
+            params={
+                "start": "2025-01-02T00:00:00",
+                "end": "2025-01-02T00:10:00",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            {
+                "timestamp": "2025-01-02T00:00:00",
+                "wind_speed": 5.0,
+                "power": 100.0,
+                "ambient_temperature": 25.0,
+            }
+        ]
+
+    def test_openapi_response_schema(self, client: TestClient):
+        schema = client.get("/openapi.json").json()
+        response = schema["paths"]["/data"]["get"]["responses"]["200"]
+
+        assert response["content"]["application/json"]["schema"] == {
+            "type": "array",
+            "items": {"$ref": "#/components/schemas/Data"},
+            "title": "Response Get Data Data Get",
+        }
+
+    def test_arrow_and_parquet(self, client: TestClient, mixer):
+        mixer.blend(
+            Data, timestamp=datetime(2025, 1, 2, 0, 0, 0), wind_speed=5.0
+        )
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T00:10:00",
+            "variables": ["wind_speed"],
+        }
+
+        arrow = client.get(
+            "/data",
+            params=params,
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        parquet = client.get(
+            "/data", params=params, headers={"Accept": "application/x-parquet"}
+        )
+
+        assert arrow.headers["content-type"] == (
+            "application/vnd.apache.arrow.stream"
+        )
+        for table in (
+            pa.ipc.open_stream(arrow.content).read_all(),
+            pq.read_table(pa.BufferReader(parquet.content)),
+        ):
+            assert table.schema.field("timestamp").type == pa.timestamp("us")
+            assert table.to_pylist() == [
+                {"timestamp": datetime(2025, 1, 2), "wind_speed": 5.0}
+            ]
+
+    def test_resample_matches_pandas(self, client: TestClient, session):
+        rng = np.random.default_rng(42)
+        timestamps = pd.date_range("2025-01-02 00:00", periods=45, freq="1min")
+        frame = pd.DataFrame(
+            {
+                "wind_speed": rng.normal(6.0, 1.5, len(timestamps)),
+                "power": rng.normal(216.0, 50.0, len(timestamps)),
+                "ambient_temperature": 25.0,
+            },
+            index=timestamps,
+        ).drop(timestamps[10:20])
+        session.add_all(
+            Data(timestamp=timestamp.to_pydatetime(), **row)
+            for timestamp, row in frame.iterrows()
+        )
+        session.commit()
+
+        response = client.get(
+            "/data/resample",
+            params={
+                "start": "2025-01-02T00:00:00",
+                "end": "2025-01-02T01:00:00",
+                "interval": "10min",
+                "aggs": "mean,min,max,std",
+                "variables": ["wind_speed", "power"],
+            },
+        )
+
+        assert response.status_code == 200
+        expected = (
+            frame[["wind_speed", "power"]]
+            .resample("10min")
+            .agg(["mean", "min", "max", "std"])
+        )
+        expected.columns = [f"{var}_{agg}" for var, agg in expected.columns]
+        result = pd.DataFrame(response.json()).set_index("timestamp")
+        result.index = pd.to_datetime(result.index)
+        pd.testing.assert_frame_equal(
+            result.astype(float), expected, check_freq=False, check_names=False
+        )
+
+    def test_resample_invalid_parameters(self, client: TestClient):
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T01:00:00",
+        }
+
+        interval = client.get(
+            "/data/resample", params={**params, "interval": "10 parsecs"}
+        )
+        aggs = client.get(
+            "/data/resample", params={**params, "aggs": "mean,median"}
+        )
+
+        assert interval.status_code == 422
+        assert aggs.status_code == 422
+
+    def test_queries_do_not_block_event_loop(self):
+        class SlowSession:
+            def connection(self):
+                pass
+
+            def exec(self, statement):
+                time.sleep(0.2)
+                return self
+
+            def all(self):
+                return []
+
+            def one(self):
+                return (0, None)
+
+        app.dependency_overrides[get_session] = SlowSession
+
+        async def request_concurrently():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await asyncio.gather(
+                    *(
+                        client.get(
+                            "/data",
+                            params={
+                                "start": "2025-01-02T00:00:00",
+                                "end": "2025-01-02T01:00:00",
+                            },
+                        )
+                        for _ in range(5)
+                    )
+                )
+
+        try:
+            started = time.perf_counter()
+            responses = asyncio.run(request_concurrently())
+            elapsed = time.perf_counter() - started
+        finally:
+            app.dependency_overrides.clear()
+
+        assert all(response.status_code == 200 for response in responses)
+        # One query per request; run serially they would take 0.2 * 5
+        assert elapsed < 0.2 * 5 / 2
+
+    def test_max_points_preserves_spikes(self, client: TestClient, session):
+        timestamps = pd.date_range(
+            "2025-01-02 00:00", periods=1000, freq="1min"
+        )
+        power = np.sin(np.arange(1000) / 50.0)
+        power[537] = 50.0
+        session.add_all(
+            Data(
+                timestamp=timestamp.to_pydatetime(),
+                wind_speed=1.0,
+                power=value,
+                ambient_temperature=25.0,
+            )
+            for timestamp, value in zip(timestamps, power)
+        )
+        session.commit()
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-03T00:00:00",
+            "variables": ["power"],
+        }
+
+        response = client.get("/data", params={**params, "max_points": 100})
+        too_small = client.get(
+            "/data",
+            params={
+                **params,
+                "variables": ["power", "wind_speed"],
+                "max_points": 3,
+            },
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert 50 <= len(data) <= 100
+        assert set(data[0]) == {"timestamp", "power"}
+        assert max(item["power"] for item in data) == 50.0
+        assert min(item["power"] for item in data) == power.min()
+        assert [item["timestamp"] for item in data] == sorted(
+            item["timestamp"] for item in data
+        )
+        assert too_small.status_code == 422
+
+    def test_day_cache(self, client: TestClient, mixer, tmp_path):
+        mixer.blend(
+            Data, timestamp=datetime(2025, 1, 2, 0, 0, 0), wind_speed=5.0
+        )
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T00:10:00",
+            "variables": ["wind_speed"],
+        }
+
+        with patch(
+            "src.routes.data.day_cache", DayBlockCache(str(tmp_path), 10**7)
+        ):
+            first = client.get("/data", params=params).json()
+            second = client.get("/data", params=params).json()
+            stats = client.get("/data/cache").json()
+
+        assert (
+            first
+            == second
+            == [{"timestamp": "2025-01-02T00:00:00", "wind_speed": 5.0}]
+        )
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_conditional_get(self, client: TestClient, mixer):
+        mixer.blend(
+            Data, timestamp=datetime(2025, 1, 2, 0, 0, 0), wind_speed=5.0
+        )
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T00:10:00",
+        }
+
+        first = client.get("/data", params=params)
+        etag = first.headers["etag"]
+        cached = client.get(
+            "/data", params=params, headers={"If-None-Match": etag}
+        )
+        other_format = client.get(
+            "/data",
+            params=params,
+            headers={"If-None-Match": etag, "Accept": "application/x-ndjson"},
+        )
+        mixer.blend(
+            Data, timestamp=datetime(2025, 1, 2, 0, 5, 0), wind_speed=6.0
+        )
+        changed = client.get(
+            "/data", params=params, headers={"If-None-Match": etag}
+        )
+
+        # Only conditional requests run the validator query
+        assert "validate" not in first.headers["server-timing"]
+        assert "validate" in cached.headers["server-timing"]
+        assert "last-modified" not in first.headers
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+        assert other_format.status_code == 200
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert len(changed.json()) == 2
+
+    def test_compression(self, client: TestClient, session):
+        start = datetime(2025, 1, 2)
+        session.add_all(
+            Data(
+                timestamp=start + timedelta(minutes=i),
+                wind_speed=1.0,
+                power=float(i),
+                ambient_temperature=25.0,
+            )
+            for i in range(100)
+        )
+        session.commit()
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T02:00:00",
+            "variables": ["power"],
+        }
+
+        zstd = client.get(
+            "/data", params=params, headers={"Accept-Encoding": "zstd, gzip"}
+        )
+        gzip = client.get(
+            "/data", params=params, headers={"Accept-Encoding": "gzip"}
+        )
+        streamed = client.get(
+            "/data",
+            params=params,
+            headers={
+                "Accept": "application/x-ndjson",
+                "Accept-Encoding": "gzip",
+            },
+        )
+        identity = client.get(
+            "/data", params=params, headers={"Accept-Encoding": "identity"}
+        )
+
+        assert zstd.headers["content-encoding"] == "zstd"
+        assert gzip.headers["content-encoding"] == "gzip"
+        assert streamed.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in identity.headers
+        assert zstd.json() == gzip.json() == identity.json()
+        assert len(streamed.text.splitlines()) == 100
+
+    def test_metrics_and_server_timing(self, client: TestClient, mixer):
+        for minute in range(3):
+            mixer.blend(
+                Data, timestamp=datetime(2025, 1, 2, 0, minute, 0), power=1.0
+            )
+        params = {
+            "start": "2025-01-02T00:00:00",
+            "end": "2025-01-02T00:10:00",
+        }
+        labels = {"route": "/data", "method": "GET", "rows_le": "100"}
+
+        def sample(name, **labels):
+            return REGISTRY.get_sample_value(name, labels) or 0.0
+
+        requests = sample("api_request_duration_seconds_count", **labels)
+        rows = sample("api_rows_returned_total", route="/data")
+        waits = sample("api_db_pool_wait_seconds_count")
+
+        response = client.get("/data", params=params)
+        streamed = client.get(
+            "/data", params=params, headers={"Accept": "application/x-ndjson"}
+        )
+        exposed = client.get("/metrics")
+
+        stages = [
+            entry.split(";")[0]
+            for entry in response.headers["server-timing"].split(", ")
+        ]
+        assert stages == [
+            "db-pool",
+            "db-execute",
+            "hydrate",
+            "serialize",
+            "compress",
+            "total",
+        ]
+        assert len(streamed.text.splitlines()) == 3
+        assert (
+            sample("api_request_duration_seconds_count", **labels)
+            == requests + 2
+        )
+        assert sample("api_rows_returned_total", route="/data") == rows + 6
+        assert sample("api_db_pool_wait_seconds_count") == waits + 1
+        assert sample("api_response_bytes_total", route="/data") > 0
+        assert "api_stage_duration_seconds_bucket" in exposed.text
+
+    def test_batch(self, client: TestClient, session):
+        start = datetime(2025, 1, 1)
+        session.add_all(
+            Data(
+                timestamp=start + timedelta(hours=hour),
+                wind_speed=float(hour),
+                power=float(hour) * 10,
+                ambient_temperature=25.0,
+            )
+            for hour in range(72)
+        )
+        session.commit()
+        # The same two hours across three days, plus a window with no data
+        windows = [
+            {
+                "start": f"2025-01-0{day}T10:00:00",
+                "end": f"2025-01-0{day}T11:00:00",
+                "variables": ["power"],
+            }
+            for day in (1, 2, 3)
+        ] + [{"start": "2025-02-01T00:00:00", "end": "2025-02-02T00:00:00"}]
+
+        response = client.post("/data/batch", json={"windows": windows})
+        streamed = client.post(
+            "/data/batch",
+            json={"windows": windows},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        too_many = client.post("/data/batch", json={"windows": windows * 200})
+        reversed_window = client.post(
+            "/data/batch",
+            json={
+                "windows": [
+                    {
+                        "start": "2025-01-02T00:00:00",
+                        "end": "2025-01-01T00:00:00",
+                    }
+                ]
+            },
+        )
+
+        results = response.json()
+        assert [len(result["data"]) for result in results] == [2, 2, 2, 0]
+        assert results[1]["variables"] == ["power"]
+        assert results[1]["data"] == [
+            {"timestamp": "2025-01-02T10:00:00", "power": 340.0},
+            {"timestamp": "2025-01-02T11:00:00", "power": 350.0},
+        ]
+        assert results[3]["variables"] == [
+            "wind_speed",
+            "power",
+            "ambient_temperature",
+        ]
+        lines = [json.loads(line) for line in streamed.text.splitlines()]
+        assert [line["window"] for line in lines] == [0, 0, 1, 1, 2, 2]
+        assert lines[2] == {
+            "window": 1,
+            "timestamp": "2025-01-02T10:00:00",
+            "power": 340.0,
+        }
+        assert too_many.status_code == 422
+        assert reversed_window.status_code == 400
+
+    def test_hot_tier(self, client: TestClient, session):
+        session.add_all(
+            Data(
+                timestamp=datetime(2025, 1, 2) + timedelta(minutes=minute),
+                wind_speed=1.0,
+                power=float(minute),
+                ambient_temperature=25.0,
+            )
+            for minute in range(120)
+        )
+        session.commit()
+        tier = HotTier(days=1)
+        tier.refresh(session)
+        # Rows answered from memory no longer need to be in the database
+        session.exec(delete(Data))
+        session.commit()
+        params = {
+            "start": "2025-01-02T01:00:00",
+            "end": "2025-01-02T01:01:00",
+            "variables": ["power"],
+        }
+
+        with patch("src.routes.data.hot_tier", tier):
+            response = client.get("/data", params=params)
+            outside = client.get(
+                "/data", params={**params, "start": "2025-01-01T00:00:00"}
+            )
+
+        assert response.json() == [
+            {"timestamp": "2025-01-02T01:00:00", "power": 60.0},
+            {"timestamp": "2025-01-02T01:01:00", "power": 61.0},
+        ]
+        assert "hot-tier" in response.headers["server-timing"]
+        assert outside.json() == []
+
+    def test_ingest(self, client: TestClient, session):
+        session.add(
+            Data(
+                timestamp=datetime(2025, 1, 1),
+                wind_speed=1.0,
+                power=1.0,
+                ambient_temperature=1.0,
+            )
+        )
+        session.commit()
+        rows = [
+            {
+                "timestamp": f"2025-01-01T00:0{minute}:00",
+                "wind_speed": 2.0,
+                "power": float(minute),
+                "ambient_temperature": 20.0,
+            }
+            for minute in range(3)
+        ]
+        ndjson = "".join(json.dumps(row) + "\n" for row in rows)
+        csv = pd.DataFrame(rows).to_csv(index=False)
+        table = pa.table(
+            {
+                "timestamp": pa.array(
+                    [datetime(2025, 1, 1, 0, 3)], pa.timestamp("ns")
+                ),
+                "wind_speed": [3.0],
+                "power": [3.0],
+                "ambient_temperature": [20.0],
+            }
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        def ingest(body, media_type):
+            return client.post(
+                "/data/ingest",
+                content=body,
+                headers={"Content-Type": media_type},
+            )
+
+        ignored = ingest(ndjson, "application/x-ndjson")
+        repeated = ingest(csv, "text/csv")
+        arrow = ingest(
+            sink.getvalue().to_pybytes(), "application/vnd.apache.arrow.stream"
+        )
+        missing = ingest(
+            '{"timestamp": "2025-01-01"}\n', "application/x-ndjson"
+        )
+        unsupported = ingest("[]", "application/json")
+
+        assert ignored.json()["received"] == 3
+        assert ignored.json()["written"] == 2
+        assert repeated.json()["written"] == 0
+        assert arrow.json()["written"] == 1
+        assert missing.status_code == 422
+        assert unsupported.status_code == 415
+        stored = session.exec(select(Data.timestamp, Data.power)).all()
+        assert [power for _, power in sorted(stored)] == [1.0, 1.0, 2.0, 3.0]
+
+    def test_stream_rejects_invalid_last_event_id(self, client: TestClient):
+        response = client.get(
+            "/data/stream", headers={"Last-Event-ID": "not-a-date"}
+        )
+        assert response.status_code == 400
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from src.db.models import Data
+from src.db.tail import TailBroadcaster
+from src.routes.data import tail_events
+
+
+def add_rows(session, start: datetime, minutes: int):
+    session.add_all(
+        Data(
+            timestamp=start + timedelta(minutes=minute),
+            wind_speed=1.0,
+            power=float(minute),
+            ambient_temperature=25.0,
+        )
+        for minute in range(minutes)
+    )
+    session.commit()
+
+
+def parse_events(chunk: bytes):
+    return [
+        json.loads(event.split(b"data: ")[1])
+        for event in chunk.split(b"\n\n")
+        if event.startswith(b"id: ")
+    ]
+
+
+def shared(session):
+    """Session factory handing out the test session, one thread at a time."""
+    lock = threading.Lock()
+
+    @contextmanager
+    def factory():
+        with lock:
+            yield session
+
+    return factory
+
+
+class TestTail:
+    def test_replays_then_follows(self, session):
+        add_rows(session, datetime(2025, 1, 1), 3)
+        factory = shared(session)
+        broadcaster = TailBroadcaster(interval=0.05, session_factory=factory)
+
+        async def follow():
+            events = tail_events(datetime(2025, 1, 1), ["power"], broadcaster)
+            replayed = parse_events(await anext(events))
+            with factory():
+                add_rows(session, datetime(2025, 1, 1, 0, 3), 2)
+            broadcaster.notify()
+            followed = parse_events(
+                await asyncio.wait_for(anext(events), timeout=1)
+            )
+            await events.aclose()
+            return replayed, followed
+
+        replayed, followed = asyncio.run(follow())
+
+        assert replayed == [
+            {"timestamp": "2025-01-01T00:01:00", "power": 1.0},
+            {"timestamp": "2025-01-01T00:02:00", "power": 2.0},
+        ]
+        assert [event["power"] for event in followed] == [0.0, 1.0]
+        assert followed[0]["timestamp"] == "2025-01-01T00:03:00"
+        assert len(broadcaster) == 0
+
+    def test_one_poll_for_all_subscribers(self, session):
+        add_rows(session, datetime(2025, 1, 1), 1)
+        factory = shared(session)
+        broadcaster = TailBroadcaster(interval=0.05, session_factory=factory)
+
+        async def follow(subscribers: int):
+            streams = [
+                tail_events(None, ["power"], broadcaster)
+                for _ in range(subscribers)
+            ]
+            pending = [asyncio.ensure_future(anext(s)) for s in streams]
+            await asyncio.sleep(0.2)
+            polls = broadcaster.polls
+            with factory():
+                add_rows(session, datetime(2025, 1, 2), 1)
+            chunks = await asyncio.wait_for(asyncio.gather(*pending), 1)
+            for stream in streams:
+                await stream.aclose()
+            return polls, chunks
+
+        polls, chunks = asyncio.run(follow(20))
+
+        # Polled once per interval, not once per subscriber and interval
+        assert polls <= 6
+        assert all(
+            parse_events(chunk)[0]["timestamp"] == "2025-01-02T00:00:00"
+            for chunk in chunks
+        )
+
+    def test_drops_lagging_subscriber(self, session):
+        add_rows(session, datetime(2025, 1, 1), 1)
+        factory = shared(session)
+        broadcaster = TailBroadcaster(
+            interval=0.01,
+            queue_size=1,
+            batch_size=1,
+            session_factory=factory,
+        )
+
+        async def lag():
+            async with broadcaster.subscribe() as (queue, cursor):
+                with factory():
+                    add_rows(session, datetime(2025, 1, 2), 3)
+                await asyncio.sleep(0.2)
+                return queue.qsize(), broadcaster.dropped(queue)
+
+        size, dropped = asyncio.run(lag())
+
+        assert size == 1
+        assert dropped
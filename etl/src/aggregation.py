@@ -0,0 +1,244 @@
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+WINDOW = "10min"
+
+Partials = Dict[str, np.ndarray]
+
+STATISTICS: Dict[str, Callable[[Partials], np.ndarray]] = {}
+
+
+def register_statistic(name: str):
+    """Register a statistic computed from the window partials.
+
+    The function receives the ``count``/``sum``/``m2``/``min``/``max``
+    arrays (windows x variables) and returns an array of the same shape.
+    """
+
+    def decorator(func: Callable[[Partials], np.ndarray]):
+        STATISTICS[name] = func
+        return func
+
+    return decorator
+
+
+@register_statistic("count")
+def _count(partials: Partials) -> np.ndarray:
+    return partials["count"]
+
+
+@register_statistic("sum")
+def _sum(partials: Partials) -> np.ndarray:
+    return partials["sum"]
+
+
+@register_statistic("m2")
+def _m2(partials: Partials) -> np.ndarray:
+    return partials["m2"]
+
+
+@register_statistic("mean")
+def _mean(partials: Partials) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return partials["sum"] / partials["count"]
+
+
+@register_statistic("min")
+def _min(partials: Partials) -> np.ndarray:
+    return partials["min"]
+
+
+@register_statistic("max")
+def _max(partials: Partials) -> np.ndarray:
+    return partials["max"]
+
+
+@register_statistic("std")
+def _std(partials: Partials) -> np.ndarray:
+    count = partials["count"]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = partials["m2"] / (count - 1)
+
+    # Sample standard deviation (ddof=1), undefined below two samples
+    return np.where(count > 1, np.sqrt(variance), np.nan)
+
+
+def compute_partials(
+    df: pd.DataFrame,
+    freq: str = WINDOW,
+) -> Tuple[pd.DatetimeIndex, Partials]:
+    """Bin rows into ``freq`` windows and reduce every column in one pass.
+
+    Windows follow ``DataFrame.resample`` defaults: they are anchored at
+    midnight of the first timestamp, labelled by their left edge, and
+    empty windows between the first and last sample are kept.
+
+    Besides ``count``/``sum``/``min``/``max``, ``m2`` holds the sum of
+    squared deviations from the window mean. Unlike a plain sum of
+    squares it does not cancel for large values with a small spread.
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise TypeError(
+            "Only valid with DatetimeIndex, "
+            f"but got an instance of '{type(df.index).__name__}'"
+        )
+
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    step = pd.Timedelta(freq)
+    values = df.to_numpy(dtype=np.float64)
+    width = values.shape[1]
+
+    if len(df) == 0:
+        empty = np.empty((0, width))
+        return df.index[:0], {
+            "count": empty.astype(np.int64),
+            "sum": empty,
+            "m2": empty,
+            "min": empty,
+            "max": empty,
+        }
+
+    origin = df.index[0].normalize()
+    offsets = df.index.asi8 - origin.as_unit(df.index.unit).value
+    window = offsets // step.as_unit(df.index.unit).value
+
+    first = window[0]
+    size = window[-1] - first + 1
+    starts = np.flatnonzero(np.r_[True, window[1:] != window[:-1]])
+    slots = window[starts] - first
+
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+
+    counts = np.add.reduceat(present.astype(np.int64), starts, axis=0)
+    sums = np.add.reduceat(filled, starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, 0.0)
+    lengths = np.diff(np.r_[starts, len(df)])
+    deviations = np.where(
+        present, values - np.repeat(means, lengths, axis=0), 0.0
+    )
+
+    def scatter(reduced: np.ndarray, fill) -> np.ndarray:
+        out = np.full((size, width), fill, dtype=reduced.dtype)
+        out[slots] = reduced
+        return out
+
+    partials = {
+        "count": scatter(counts, 0),
+        "sum": scatter(sums, 0.0),
+        "m2": scatter(
+            np.add.reduceat(deviations * deviations, starts, axis=0), 0.0
+        ),
+        "min": scatter(np.fmin.reduceat(values, starts, axis=0), np.nan),
+        "max": scatter(np.fmax.reduceat(values, starts, axis=0), np.nan),
+    }
+
+    index = pd.date_range(
+        start=origin + first * step,
+        periods=size,
+        freq=freq,
+        name=df.index.name,
+        unit=df.index.unit,
+    )
+
+    return index, partials
+
+
+# How each partial combines across windows. ``m2`` is summed once the
+# spread of the window means around the merged mean is added to it
+MERGES = {
+    "count": np.add,
+    "sum": np.add,
+    "m2": np.add,
+    "min": np.fmin,
+    "max": np.fmax,
+}
+
+
+def merge_partials(
+    index: pd.DatetimeIndex,
+    partials: Partials,
+    freq: str,
+) -> Tuple[pd.DatetimeIndex, Partials]:
+    """Combine sorted window partials into coarser ``freq`` windows.
+
+    Statistics of the merged windows equal those computed from the raw
+    rows, so hourly and daily views never need the source data again.
+    Only coarse windows containing at least one input window are kept.
+    """
+    if len(index) == 0:
+        return index, partials
+
+    coarse = index.floor(freq)
+    starts = np.flatnonzero(np.r_[True, coarse[1:] != coarse[:-1]])
+    lengths = np.diff(np.r_[starts, len(index)])
+
+    count = partials["count"]
+    total = partials["sum"]
+    merged_count = np.add.reduceat(count, starts, axis=0)
+    merged_total = np.add.reduceat(total, starts, axis=0)
+
+    # Parallel variance: m2 of the union is the windows' m2 plus the
+    # spread of each window mean around the mean of the union
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, 0.0)
+        merged_mean = np.where(
+            merged_count > 0, merged_total / merged_count, 0.0
+        )
+    spread = mean - np.repeat(merged_mean, lengths, axis=0)
+    partials = {
+        **partials,
+        "m2": partials["m2"] + count * spread**2,
+    }
+
+    return coarse[starts], {
+        name: merge.reduceat(partials[name], starts, axis=0)
+        for name, merge in MERGES.items()
+    }
+
+
+def finalize(
+    index: pd.DatetimeIndex,
+    partials: Partials,
+    variables: Iterable[str],
+    aggregations: Iterable[str],
+    suffix: str = "",
+) -> pd.DataFrame:
+    """Statistics of window partials as ``<variable>_<aggregation>`` columns.
+
+    Column positions of ``partials`` follow ``variables``. A ``suffix``
+    is appended to every column name, as in ``power_mean_1h``.
+    """
+    aggregations = list(aggregations)
+
+    unknown = [name for name in aggregations if name not in STATISTICS]
+    if unknown:
+        raise ValueError(f"Unknown aggregations: {', '.join(unknown)}")
+
+    results = {name: STATISTICS[name](partials) for name in aggregations}
+
+    return pd.DataFrame(
+        {
+            f"{variable}_{name}{suffix}": results[name][:, position]
+            for position, variable in enumerate(variables)
+            for name in aggregations
+        },
+        index=index,
+    )
+
+
+def aggregate(
+    df: pd.DataFrame,
+    aggregations: Iterable[str],
+    freq: str = WINDOW,
+) -> pd.DataFrame:
+    """Windowed statistics as ``<variable>_<aggregation>`` columns."""
+    index, partials = compute_partials(df, freq)
+
+    return finalize(index, partials, df.columns, aggregations)
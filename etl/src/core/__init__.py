@@ -1,3 +1,10 @@
-from .settings import Settings
+def __getattr__(name):
+    # Settings are built on first use, pydantic-settings is slow to import.
+    # They live in ``config`` so no submodule shares the ``settings`` name.
+    if name == "settings":
+        from .config import Settings
 
-settings = Settings()
+        globals()["settings"] = Settings()
+        return globals()["settings"]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
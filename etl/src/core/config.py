@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class Settings(BaseSettings):
+    source_api_url: str
+    target_db_url: str
+    load_batch_size: int = 5000
+    etl_workers: int = 4
+    extract_async: bool = False
+    extract_window_minutes: int = 180
+    extract_concurrency: int = 4
+    extract_retries: int = 3
+    extract_backoff: float = 0.5
+    incremental_start_date: str = "2025-01-01"
+    incremental_max_span_hours: int = 24
+    # Windows are aggregated only this long after they close, so rows
+    # arriving a little late are still included
+    incremental_lateness_minutes: int = 5
+    staging_dir: Optional[str] = None
+    backfill_span_days: int = 31
+    staging_max_bytes: int = 2 * 1024 * 1024 * 1024
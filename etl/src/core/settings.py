@@ -1,8 +0,0 @@
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-load_dotenv()
-
-class Settings(BaseSettings):
-    source_api_url: str
-    target_db_url: str
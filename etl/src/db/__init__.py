@@ -1,12 +1,27 @@
-from sqlalchemy import create_engine
-from sqlmodel import Session
+from functools import lru_cache
 
-from src.core import settings
 
-engine = create_engine(settings.target_db_url)
+@lru_cache(maxsize=None)
+def get_engine():
+    """Target database engine, created on first use."""
+    from sqlalchemy import create_engine
 
-def get_session() -> Session:
-    with Session(engine) as session:
+    from src.core import settings
+
+    return create_engine(settings.target_db_url)
+
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_session():
+    from sqlmodel import Session
+
+    with Session(get_engine()) as session:
         try:
             yield session
         except Exception as exc:
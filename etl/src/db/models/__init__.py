@@ -1,3 +1,5 @@
 from .signal import Signal, Data
+from .source_validator import SourceValidator
+from .watermark import Watermark
 
-__all__ = ["Signal", "Data"]
+__all__ = ["Signal", "Data", "SourceValidator", "Watermark"]
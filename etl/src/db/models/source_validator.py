@@ -0,0 +1,8 @@
+from sqlmodel import SQLModel, Field
+
+
+class SourceValidator(SQLModel, table=True):
+    __tablename__ = "source_validator"
+
+    key: str = Field(primary_key=True)
+    etag: str
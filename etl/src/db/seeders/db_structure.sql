@@ -58,6 +58,30 @@ CREATE TABLE public.signal (
 
 ALTER TABLE public.signal OWNER TO delfos;
 
+--
+-- Name: watermark; Type: TABLE; Schema: public; Owner: delfos
+--
+
+CREATE TABLE public.watermark (
+    name character varying NOT NULL,
+    "timestamp" timestamp without time zone NOT NULL
+);
+
+
+ALTER TABLE public.watermark OWNER TO delfos;
+
+--
+-- Name: source_validator; Type: TABLE; Schema: public; Owner: delfos
+--
+
+CREATE TABLE public.source_validator (
+    key character varying NOT NULL,
+    etag character varying NOT NULL
+);
+
+
+ALTER TABLE public.source_validator OWNER TO delfos;
+
 --
 -- Name: signal_id_seq; Type: SEQUENCE; Schema: public; Owner: delfos
 --
@@ -111,6 +135,22 @@ ALTER TABLE ONLY public.signal
     ADD CONSTRAINT signal_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: watermark watermark_pkey; Type: CONSTRAINT; Schema: public; Owner: delfos
+--
+
+ALTER TABLE ONLY public.watermark
+    ADD CONSTRAINT watermark_pkey PRIMARY KEY (name);
+
+
+--
+-- Name: source_validator source_validator_pkey; Type: CONSTRAINT; Schema: public; Owner: delfos
+--
+
+ALTER TABLE ONLY public.source_validator
+    ADD CONSTRAINT source_validator_pkey PRIMARY KEY (key);
+
+
 --
 -- Name: ix_signal_name; Type: INDEX; Schema: public; Owner: delfos
 --
@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+import httpx
+import pandas as pd
+
+from src.core import settings
+
+# The source API treats ``end`` as inclusive
+RESOLUTION = timedelta(microseconds=1)
+
+ARROW = "application/vnd.apache.arrow.stream"
+# Typed columnar payload when the API supports it, JSON otherwise
+ACCEPT = f"{ARROW}, application/json;q=0.5"
+
+
+class NotModified(Exception):
+    """The source answered a conditional request with 304."""
+
+
+def to_frame(records: list) -> pd.DataFrame:
+    df = pd.DataFrame(records)
+
+    if df.empty:
+        return df
+
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df.set_index("timestamp", inplace=True)
+
+    return df
+
+
+def decode_response(response: httpx.Response) -> pd.DataFrame:
+    content_type = response.headers.get("content-type", "")
+
+    if content_type.split(";")[0].strip() != ARROW:
+        return to_frame(response.json())
+
+    # Only needed when the API answers with Arrow
+    import pyarrow as pa
+
+    df = pa.ipc.open_stream(response.content).read_pandas()
+
+    if df.empty:
+        return pd.DataFrame()
+
+    return df.set_index("timestamp")
+
+
+def split_windows(
+    start: datetime,
+    stop: datetime,
+    size: timedelta,
+) -> List[Tuple[datetime, datetime]]:
+    """Split ``[start, stop)`` into consecutive inclusive API windows."""
+    windows = []
+    cursor = start
+
+    while cursor < stop:
+        upper = min(cursor + size, stop)
+        windows.append((cursor, upper - RESOLUTION))
+        cursor = upper
+
+    return windows
+
+
+async def _get_window(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    params: dict,
+    retries: int,
+    backoff: float,
+) -> pd.DataFrame:
+    for attempt in range(retries + 1):
+        try:
+            async with semaphore:
+                response = await client.get(
+                    "/data", params=params, headers={"Accept": ACCEPT}
+                )
+            response.raise_for_status()
+            return decode_response(response)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code < 500 or attempt == retries:
+                raise
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+
+        await asyncio.sleep(backoff * 2**attempt)
+
+
+async def fetch_source_data_async(
+    start: datetime,
+    stop: datetime,
+    variables: Iterable[str],
+    client: Optional[httpx.AsyncClient] = None,
+    window: Optional[timedelta] = None,
+    concurrency: Optional[int] = None,
+    retries: Optional[int] = None,
+    backoff: Optional[float] = None,
+) -> pd.DataFrame:
+    """Fetch ``[start, stop)`` as concurrent sub-window requests.
+
+    Windows are fetched at most ``concurrency`` at a time, transport
+    errors and 5xx responses are retried with exponential backoff, and
+    the frames are concatenated in time order.
+    """
+    window = window or timedelta(minutes=settings.extract_window_minutes)
+    concurrency = concurrency or settings.extract_concurrency
+    retries = settings.extract_retries if retries is None else retries
+    backoff = settings.extract_backoff if backoff is None else backoff
+
+    close_client = False
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=settings.source_api_url,
+            timeout=30,
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+        close_client = True
+
+    semaphore = asyncio.Semaphore(concurrency)
+    variables = list(variables)
+
+    try:
+        frames = await asyncio.gather(
+            *(
+                _get_window(
+                    client,
+                    semaphore,
+                    {
+                        "start": lower.isoformat(),
+                        "end": upper.isoformat(),
+                        "variables": variables,
+                    },
+                    retries,
+                    backoff,
+                )
+                for lower, upper in split_windows(start, stop, window)
+            )
+        )
+    finally:
+        if close_client:
+            await client.aclose()
+
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames)
+
+    return df[~df.index.duplicated()]
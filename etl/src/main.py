@@ -1,22 +1,34 @@
-import sys
+from __future__ import annotations
+
+import argparse
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
 
-import httpx
-import pandas as pd
-from sqlmodel import Session, select
-from sqlalchemy.engine import Engine
+# pandas, httpx, SQLModel and settings are imported where they are used,
+# so the CLI and the Dagster code location start without loading them
+if TYPE_CHECKING:
+    from datetime import date
 
-from src.db import engine as default_engine
-from src.db.models import Signal, Data
-from src.core import settings
+    import httpx
+    import pandas as pd
+    from sqlalchemy.engine import Engine
+    from sqlmodel import Session
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 AGGREGATIONS = ["mean", "min", "max", "std"]
+# Stored next to the statistics so coarser windows can be merged from them
+PARTIALS = ["count", "sum", "m2"]
 VARIABLES = ["wind_speed", "power"]
+# Signal name suffix -> window, each rolled up from the one before
+ROLLUPS = {"1h": "1h", "1d": "1D"}
+INCREMENTAL_WATERMARK = "incremental_etl"
 
 def parse_date(date_str: str) -> datetime:
     try:
@@ -24,17 +36,21 @@ def parse_date(date_str: str) -> datetime:
     except ValueError:
         raise ValueError("Date must be in YYYY-MM-DD format")
 
-def fetch_source_data(
-    date: datetime,
+def fetch_source_range(
+    start: datetime,
+    stop: datetime,
     client: Optional[httpx.Client] = None,
     variables: Iterable[str] = VARIABLES,
+    etag: Optional[str] = None,
 ) -> pd.DataFrame:
-    start = date
-    end = date + timedelta(days=1) - timedelta(seconds=1)
+    import httpx
+
+    from src.core import settings
+    from src.extract import ACCEPT, RESOLUTION, NotModified, decode_response
 
     params = {
         "start": start.isoformat(),
-        "end": end.isoformat(),
+        "end": (stop - RESOLUTION).isoformat(),
         "variables": list(variables),
     }
 
@@ -46,124 +62,888 @@ def fetch_source_data(
         )
         close_client = True
 
+    headers = {"Accept": ACCEPT}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+
     try:
-        response = client.get("/data", params=params)
-        response.raise_for_status()
+        response = client.get("/data", params=params, headers=headers)
     finally:
         if close_client:
             client.close()
 
-    df = pd.DataFrame(response.json())
+    if response.status_code == 304:
+        raise NotModified(etag)
+    response.raise_for_status()
+
+    df = decode_response(response)
+    df.attrs["etag"] = response.headers.get("etag")
+
+    return df
+
+
+def fetch_source_data(
+    date: datetime,
+    client: Optional[httpx.Client] = None,
+    variables: Iterable[str] = VARIABLES,
+    etag: Optional[str] = None,
+) -> pd.DataFrame:
+    df = fetch_source_range(
+        date,
+        date + timedelta(days=1),
+        client=client,
+        variables=variables,
+        etag=etag,
+    )
 
     if df.empty:
         raise RuntimeError("No data returned from source API")
 
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df.set_index("timestamp", inplace=True)
+    return df
+
+
+def fetch_source_data_concurrently(
+    date: datetime,
+    variables: Iterable[str] = VARIABLES,
+) -> pd.DataFrame:
+    import asyncio
+
+    from src.extract import fetch_source_data_async
+
+    df = asyncio.run(
+        fetch_source_data_async(date, date + timedelta(days=1), variables)
+    )
+
+    if df.empty:
+        raise RuntimeError("No data returned from source API")
 
     return df
 
 def aggregate_data(df: pd.DataFrame) -> pd.DataFrame:
-    aggregated = (
-        df
-        .resample("10min")
-        .agg(AGGREGATIONS)
-    )
+    from src.aggregation import aggregate
 
-    aggregated.columns = [
-        f"{var}_{agg}"
-        for var, agg in aggregated.columns
-    ]
+    return drop_empty(aggregate(df, AGGREGATIONS + PARTIALS))
+
+
+def drop_empty(aggregated: pd.DataFrame, suffix: str = "") -> pd.DataFrame:
+    """Blank the statistics of windows where a variable has no samples.
+
+    Empty windows between the first and last sample come out of the
+    aggregation with zero partials. Blanked, they are skipped by
+    ``load_data`` instead of being stored and merged into rollups.
+    """
+    import numpy as np
+
+    aggregated = aggregated.copy()
+    for variable in VARIABLES:
+        count = f"{variable}_count{suffix}"
+        if count not in aggregated:
+            continue
+
+        empty = aggregated[count].to_numpy() == 0
+        if not empty.any():
+            continue
+
+        names = [
+            f"{variable}_{name}{suffix}"
+            for name in AGGREGATIONS + PARTIALS
+            if f"{variable}_{name}{suffix}" in aggregated
+        ]
+        aggregated[names] = aggregated[names].where(
+            np.broadcast_to(~empty[:, None], (len(empty), len(names)))
+        )
 
     return aggregated
 
+
+# name -> id maps per target database, kept for the lifetime of the process
+_signal_cache: Dict[str, Dict[str, int]] = {}
+
+
+def _insert(session: Session, model):
+    if session.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    return insert(model)
+
+
+def _resolve_signals(session: Session, names: List[str]) -> Dict[str, int]:
+    from sqlmodel import select
+
+    from src.db.models import Signal
+
+    resolved = dict(
+        session.exec(
+            select(Signal.name, Signal.id).where(Signal.name.in_(names))
+        ).all()
+    )
+
+    missing = [name for name in names if name not in resolved]
+    if not missing:
+        return resolved
+
+    created = session.execute(
+        _insert(session, Signal)
+        .values([{"name": name} for name in missing])
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Signal.name, Signal.id)
+    ).all()
+    session.commit()
+    resolved.update(dict(created))
+
+    # Signals created by a concurrent run are skipped by the insert above
+    raced = [name for name in missing if name not in resolved]
+    if raced:
+        resolved.update(
+            session.exec(
+                select(Signal.name, Signal.id).where(Signal.name.in_(raced))
+            ).all()
+        )
+
+    return resolved
+
+
 def ensure_signals(
     session: Session,
     variables: Iterable[str] = VARIABLES,
-    aggregations: Iterable[str] = AGGREGATIONS,
+    aggregations: Iterable[str] = AGGREGATIONS + PARTIALS,
+    resolutions: Iterable[Optional[str]] = (None, *ROLLUPS),
 ) -> Dict[str, int]:
-    signal_map: Dict[str, int] = {}
-
-    existing = {
-        signal.name: signal
-        for signal in session.exec(select(Signal)).all()
-    }
-
-    for variable in variables:
-        for agg in aggregations:
-            name = f"{variable}_{agg}"
+    # Every signal a run writes is resolved up front, since creating
+    # signals commits the session
+    aggregations = list(aggregations)
+    names = [
+        f"{variable}_{agg}" + (f"_{resolution}" if resolution else "")
+        for resolution in resolutions
+        for variable in variables
+        for agg in aggregations
+    ]
 
-            if name not in existing:
-                signal = Signal(name=name)
-                session.add(signal)
-                session.commit()
-                session.refresh(signal)
-            else:
-                signal = existing[name]
+    url = session.get_bind().url.render_as_string(hide_password=False)
+    cache = _signal_cache.setdefault(url, {})
 
-            signal_map[name] = signal.id
+    missing = [name for name in names if name not in cache]
+    if missing:
+        cache.update(_resolve_signals(session, missing))
 
-    return signal_map
+    return {name: cache[name] for name in names}
 
 
 def load_data(
     session: Session,
     aggregated: pd.DataFrame,
     signal_map: Dict[str, int],
+    batch_size: Optional[int] = None,
+    commit: bool = True,
+    update: bool = False,
+) -> int:
+    from src.core import settings
+    from src.db.models import Data
+
+    batch_size = batch_size or settings.load_batch_size
+
+    # Long form: one row per (timestamp, signal_id) with a non-null value
+    wide = aggregated.set_axis(
+        [signal_map[name] for name in aggregated.columns], axis=1
+    )
+    wide.index = wide.index.rename("timestamp")
+    long = (
+        wide.reset_index()
+        .melt(id_vars="timestamp", var_name="signal_id", value_name="value")
+        .dropna(subset=["value"])
+    )
+
+    if long.empty:
+        return 0
+
+    records = [
+        {"timestamp": timestamp, "signal_id": signal_id, "value": value}
+        for timestamp, signal_id, value in zip(
+            long["timestamp"].to_numpy("datetime64[us]").tolist(),
+            long["signal_id"].astype(int).tolist(),
+            long["value"].astype(float).tolist(),
+        )
+    ]
+
+    # Rollups of windows still filling up are rewritten on every run
+    statement = _insert(session, Data)
+    if update:
+        statement = statement.on_conflict_do_update(
+            index_elements=["timestamp", "signal_id"],
+            set_={"value": statement.excluded.value},
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(
+            index_elements=["timestamp", "signal_id"]
+        )
+
+    for offset in range(0, len(records), batch_size):
+        session.execute(statement, records[offset:offset + batch_size])
+
+    if commit:
+        session.commit()
+
+    return len(records)
+
+
+def read_partials(
+    session: Session,
+    lower: datetime,
+    upper: datetime,
+    variables: Iterable[str] = VARIABLES,
 ):
-    records = []
-
-    for timestamp, row in aggregated.iterrows():
-        for signal_name, value in row.items():
-            if pd.isna(value):
-                continue
-
-            signal_id = signal_map[signal_name]
-            
-            # Check if record already exists
-            existing = session.exec(
-                select(Data).where(
-                    Data.timestamp == timestamp,
-                    Data.signal_id == signal_id
-                )
-            ).first()
-            
-            if existing is None:
-                records.append(
-                    Data(
-                        timestamp=timestamp,
-                        signal_id=signal_id,
-                        value=float(value),
+    """Stored 10-minute partials of ``[lower, upper)`` as merge inputs.
+
+    Returns the window index, the partial arrays and the variables they
+    cover. Variables without stored partials are left out, as are days
+    loaded before partials were stored.
+    """
+    import numpy as np
+    import pandas as pd
+    from sqlmodel import select
+
+    from src.aggregation import MERGES
+    from src.db.models import Data, Signal
+
+    variables = list(variables)
+    names = [f"{variable}_{name}" for variable in variables for name in MERGES]
+    rows = session.exec(
+        select(Data.timestamp, Signal.name, Data.value)
+        .join(Signal)
+        .where(
+            Signal.name.in_(names),
+            Data.timestamp >= lower,
+            Data.timestamp < upper,
+        )
+    ).all()
+
+    wide = (
+        pd.DataFrame(rows, columns=["timestamp", "name", "value"])
+        .pivot(index="timestamp", columns="name", values="value")
+        .sort_index()
+    )
+    variables = [
+        variable for variable in variables if f"{variable}_count" in wide
+    ]
+
+    def column(name: str) -> np.ndarray:
+        return wide.reindex(
+            columns=[f"{variable}_{name}" for variable in variables]
+        ).to_numpy(dtype=np.float64)
+
+    partials = {
+        "count": np.nan_to_num(column("count")).astype(np.int64),
+        "sum": np.nan_to_num(column("sum")),
+        "m2": np.nan_to_num(column("m2")),
+        "min": column("min"),
+        "max": column("max"),
+    }
+
+    return pd.DatetimeIndex(wide.index), partials, variables
+
+
+def keep_missing(
+    frame: pd.DataFrame, missing: Dict[date, Set[str]]
+) -> pd.DataFrame:
+    """Blank every value whose (day, signal) is not in ``missing``."""
+    import numpy as np
+
+    days = frame.index.normalize().date
+    mask = np.array(
+        [
+            [name in missing.get(day, ()) for name in frame.columns]
+            for day in days
+        ],
+        dtype=bool,
+    ).reshape(frame.shape)
+
+    return frame.where(mask)
+
+
+def rollup_data(
+    session: Session,
+    start: datetime,
+    stop: datetime,
+    variables: Iterable[str] = VARIABLES,
+    missing: Optional[Dict[date, Set[str]]] = None,
+) -> int:
+    """Rewrite the hourly and daily rollups of the days in ``[start, stop)``.
+
+    They are merged from the 10-minute partials already in the target
+    database, so the source API is not read again. Hours and days still
+    filling up are overwritten by later runs. With ``missing``, only
+    those (day, signal) pairs are written. The caller commits.
+    """
+    import pandas as pd
+
+    from src.aggregation import finalize, merge_partials
+
+    lower = pd.Timestamp(start).floor("1D").to_pydatetime()
+    upper = pd.Timestamp(stop).ceil("1D").to_pydatetime()
+    index, partials, variables = read_partials(
+        session, lower, upper, variables
+    )
+
+    if not variables:
+        return 0
+
+    written = 0
+    for resolution, freq in ROLLUPS.items():
+        index, partials = merge_partials(index, partials, freq)
+        rolled = drop_empty(
+            finalize(
+                index,
+                partials,
+                variables,
+                AGGREGATIONS + PARTIALS,
+                suffix=f"_{resolution}",
+            ),
+            suffix=f"_{resolution}",
+        )
+        if missing is not None:
+            rolled = keep_missing(rolled, missing)
+        signal_map = ensure_signals(
+            session, variables, resolutions=[resolution]
+        )
+        written += load_data(
+            session, rolled, signal_map, commit=False, update=True
+        )
+
+    return written
+
+
+def missing_signals(
+    session: Session,
+    signal_map: Dict[str, int],
+    start: datetime,
+    stop: datetime,
+) -> Dict[date, Set[str]]:
+    """Signals of ``signal_map`` with no row, per day of ``[start, stop)``."""
+    from sqlmodel import func, select
+
+    from src.db.models import Data
+
+    names = {signal_id: name for name, signal_id in signal_map.items()}
+    day = func.date(Data.timestamp)
+    covered = session.exec(
+        select(Data.signal_id, day)
+        .where(
+            Data.signal_id.in_(list(names)),
+            Data.timestamp >= start,
+            Data.timestamp < stop,
+        )
+        .group_by(Data.signal_id, day)
+    ).all()
+
+    missing = {
+        (start + timedelta(days=offset)).date(): set(signal_map)
+        for offset in range((stop - start).days)
+    }
+    for signal_id, value in covered:
+        # A date on PostgreSQL, an ISO string on SQLite
+        missing[datetime.fromisoformat(str(value)).date()].discard(
+            names[signal_id]
+        )
+
+    return {day: names for day, names in missing.items() if names}
+
+
+STAGES = ("extract", "transform", "load")
+
+
+@dataclass
+class RunStats:
+    days: int = 0
+    rows: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(STAGES, 0)
+    )
+    seconds: Dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(STAGES, 0.0)
+    )
+
+    @contextmanager
+    def timed(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - started
+
+    def merge(self, other: "RunStats"):
+        self.days += other.days
+        for stage in STAGES:
+            self.rows[stage] += other.rows[stage]
+            self.seconds[stage] += other.seconds[stage]
+
+    def log_summary(self, elapsed: float):
+        logger.info("Processed %d day(s) in %.2fs", self.days, elapsed)
+        for stage in STAGES:
+            rows, seconds = self.rows[stage], self.seconds[stage]
+            logger.info(
+                "%-9s %10d rows %8.2fs %12.0f rows/s",
+                stage,
+                rows,
+                seconds,
+                rows / seconds if seconds else 0,
+            )
+
+
+def parse_date_range(
+    start_str: str,
+    end_str: Optional[str] = None,
+) -> List[datetime]:
+    start = parse_date(start_str)
+    end = parse_date(end_str) if end_str else start
+
+    if end < start:
+        raise ValueError("End date must not be earlier than start date")
+
+    return [
+        start + timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+    ]
+
+
+def _run_day(
+    date: datetime,
+    engine: Engine,
+    api_client: Optional[httpx.Client],
+    async_extract: bool = False,
+    refresh: bool = False,
+) -> RunStats:
+    from sqlmodel import Session
+
+    from src.db.models import SourceValidator
+    from src.extract import NotModified
+    from src.staging import get_staging
+
+    stats = RunStats(days=1)
+    staging = get_staging()
+
+    logger.info("Running ETL for date %s", date.date())
+
+    # ETag of the last day loaded, so retries of unchanged days are skipped,
+    # staged or not. A refresh downloads the day again whatever the source
+    # says
+    key = date.date().isoformat()
+    with Session(engine) as session:
+        validator = session.get(SourceValidator, key)
+    etag = validator.etag if validator is not None and not refresh else None
+
+    with stats.timed("extract"):
+        # Staged days are reprocessed from disk without asking the source.
+        # Their file keeps the source ETag, so a staged day already loaded
+        # is skipped and the validator survives a re-read
+        df = None if refresh else staging.read(date, VARIABLES)
+        if df is not None:
+            if etag is not None and df.attrs.get("etag") == etag:
+                logger.info("Staged %s already loaded, skipping", key)
+                return stats
+            logger.info("Read %s from the staging area", key)
+        else:
+            try:
+                if async_extract:
+                    df = fetch_source_data_concurrently(date)
+                else:
+                    df = fetch_source_data(
+                        date, client=api_client, etag=etag
                     )
+            except NotModified:
+                logger.info("Source data for %s not modified, skipping", key)
+                return stats
+            staging.write(date, VARIABLES, df)
+    stats.rows["extract"] = len(df)
+
+    with stats.timed("transform"):
+        aggregated = aggregate_data(df)
+    stats.rows["transform"] = len(aggregated)
+
+    with Session(engine) as session:
+        signal_map = ensure_signals(session)
+        with stats.timed("load"):
+            # The complete day supersedes windows incremental runs loaded
+            # before their late rows arrived
+            stats.rows["load"] = load_data(
+                session, aggregated, signal_map, commit=False, update=True
+            )
+            stats.rows["load"] += rollup_data(
+                session, date, date + timedelta(days=1)
+            )
+            if df.attrs.get("etag"):
+                session.merge(SourceValidator(key=key, etag=df.attrs["etag"]))
+            session.commit()
+
+    logger.info("ETL completed successfully for %s", date.date())
+
+    return stats
+
+
+def run_etl(
+    date_str: str,
+    end_date_str: Optional[str] = None,
+    *,
+    workers: Optional[int] = None,
+    async_extract: Optional[bool] = None,
+    refresh: bool = False,
+    engine: Optional[Engine] = None,
+    api_client: Optional[httpx.Client] = None,
+) -> RunStats:
+    import httpx
+
+    from src.core import settings
+    from src.db import get_engine
+
+    engine = engine or get_engine()
+    dates = parse_date_range(date_str, end_date_str)
+    if async_extract is None:
+        async_extract = settings.extract_async
+    workers = max(1, min(workers or settings.etl_workers, len(dates)))
+
+    stats = RunStats()
+    started = time.perf_counter()
+
+    if len(dates) == 1:
+        stats.merge(
+            _run_day(dates[0], engine, api_client, async_extract, refresh)
+        )
+        stats.log_summary(time.perf_counter() - started)
+        return stats
+
+    # One HTTP client and one engine are shared by every worker thread
+    close_client = False
+    if api_client is None:
+        api_client = httpx.Client(
+            base_url=settings.source_api_url,
+            timeout=30,
+            limits=httpx.Limits(max_connections=workers),
+        )
+        close_client = True
+
+    failed = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_day,
+                    date,
+                    engine,
+                    api_client,
+                    async_extract,
+                    refresh,
+                ): date
+                for date in dates
+            }
+
+            for future in as_completed(futures):
+                try:
+                    stats.merge(future.result())
+                except Exception:
+                    logger.exception(
+                        "ETL failed for %s", futures[future].date()
+                    )
+                    failed.append(futures[future].date())
+    finally:
+        if close_client:
+            api_client.close()
+
+    stats.log_summary(time.perf_counter() - started)
+
+    if failed:
+        raise RuntimeError(
+            "ETL failed for "
+            + ", ".join(str(date) for date in sorted(failed))
+        )
+
+    return stats
+
+
+def run_incremental(
+    *,
+    engine: Optional[Engine] = None,
+    api_client: Optional[httpx.Client] = None,
+    now: Optional[datetime] = None,
+) -> RunStats:
+    """Aggregate the 10-minute windows closed since the last run.
+
+    The high-water mark is the end of the last window the source
+    returned rows for, so empty windows at the end of a span are asked
+    for again next run. Only a span that came back empty and is older
+    than the closed windows is skipped over. The mark is advanced in the
+    same transaction that loads the aggregates, so a failed run is simply
+    retried from the same point. Rows later than that are picked up by
+    the daily run.
+    """
+    import pandas as pd
+    from sqlmodel import Session
+
+    from src.aggregation import WINDOW
+    from src.core import settings
+    from src.db import get_engine
+    from src.db.models import Watermark
+
+    engine = engine or get_engine()
+    now = now or datetime.now()
+    lateness = timedelta(minutes=settings.incremental_lateness_minutes)
+    closed = pd.Timestamp(now - lateness).floor(WINDOW).to_pydatetime()
+
+    stats = RunStats()
+    started = time.perf_counter()
+
+    with Session(engine) as session:
+        watermark = session.get(Watermark, INCREMENTAL_WATERMARK)
+        start = (
+            watermark.timestamp
+            if watermark is not None
+            else parse_date(settings.incremental_start_date)
+        )
+        stop = min(
+            closed,
+            start + timedelta(hours=settings.incremental_max_span_hours),
+        )
+
+        if stop <= start:
+            logger.info("No closed windows after %s", start)
+            return stats
+
+        logger.info("Running incremental ETL for %s to %s", start, stop)
+
+        with stats.timed("extract"):
+            df = fetch_source_range(start, stop, client=api_client)
+        stats.rows["extract"] = len(df)
+
+        # A gap in the source longer than a span must not stall the mark
+        mark = stop if stop < closed else start
+
+        if not df.empty:
+            with stats.timed("transform"):
+                aggregated = aggregate_data(df)
+                aggregated = aggregated[
+                    (aggregated.index >= start) & (aggregated.index < stop)
+                ]
+            stats.rows["transform"] = len(aggregated)
+
+            if not aggregated.empty:
+                last = aggregated.index.max() + pd.Timedelta(WINDOW)
+                mark = max(mark, last.to_pydatetime())
+
+            signal_map = ensure_signals(session)
+            with stats.timed("load"):
+                stats.rows["load"] = load_data(
+                    session, aggregated, signal_map, commit=False
                 )
+                stats.rows["load"] += rollup_data(session, start, stop)
 
-    if records:
-        session.bulk_save_objects(records)
+        if mark > start:
+            session.merge(
+                Watermark(name=INCREMENTAL_WATERMARK, timestamp=mark)
+            )
         session.commit()
 
-def run_etl(
+    stats.log_summary(time.perf_counter() - started)
+
+    return stats
+
+
+def _backfill_span(
+    session: Session,
+    start: datetime,
+    stop: datetime,
+    missing: Dict[date, Set[str]],
+    signal_map: Dict[str, int],
+    api_client: Optional[httpx.Client],
+) -> RunStats:
+    import pandas as pd
+
+    from src.aggregation import MERGES, aggregate, finalize
+
+    stats = RunStats(days=(stop - start).days)
+    wanted = set().union(*missing.values())
+    variables = [
+        variable
+        for variable in VARIABLES
+        if any(
+            f"{variable}_{agg}" in wanted
+            for agg in AGGREGATIONS + PARTIALS
+        )
+    ]
+    # Statistics of variables whose partials are stored every day are
+    # computed from them; other variables are read from the source
+    stored = [
+        variable
+        for variable in variables
+        if not any(
+            f"{variable}_{name}" in names
+            for names in missing.values()
+            for name in MERGES
+        )
+    ]
+    fetched = [variable for variable in variables if variable not in stored]
+
+    frames = []
+    if stored:
+        index, partials, covered = read_partials(session, start, stop, stored)
+        frames.append(
+            drop_empty(
+                finalize(index, partials, covered, AGGREGATIONS + PARTIALS)
+            )
+        )
+    if fetched:
+        with stats.timed("extract"):
+            df = fetch_source_range(
+                start, stop, client=api_client, variables=fetched
+            )
+        stats.rows["extract"] = len(df)
+        if not df.empty:
+            with stats.timed("transform"):
+                frames.append(
+                    drop_empty(aggregate(df, AGGREGATIONS + PARTIALS))
+                )
+
+    with stats.timed("load"):
+        if frames:
+            aggregated = keep_missing(pd.concat(frames, axis=1), missing)
+            stats.rows["transform"] = int(
+                aggregated.notna().any(axis=1).sum()
+            )
+            stats.rows["load"] = load_data(
+                session, aggregated, signal_map, commit=False
+            )
+        stats.rows["load"] += rollup_data(
+            session, start, stop, missing=missing
+        )
+        session.commit()
+
+    return stats
+
+
+def run_backfill(
     date_str: str,
+    end_date_str: Optional[str] = None,
     *,
-    engine: Engine = default_engine,
+    engine: Optional[Engine] = None,
     api_client: Optional[httpx.Client] = None,
-):
-    date = parse_date(date_str)
+) -> RunStats:
+    """Load only the (signal, day) pairs missing from the target.
 
-    logger.info("Running ETL for date %s", date.date())
+    Configured signals are diffed against the days each one already
+    covers. Missing statistics of variables whose partials are stored
+    are computed from the target alone. Only variables without partials
+    are read from the source, in one request per span of consecutive
+    days needing them (at most ``BACKFILL_SPAN_DAYS``).
+    """
+    from sqlmodel import Session
+
+    from src.core import settings
+    from src.db import get_engine
+
+    engine = engine or get_engine()
+    dates = parse_date_range(date_str, end_date_str)
 
-    df = fetch_source_data(date, client=api_client)
-    aggregated = aggregate_data(df)
+    stats = RunStats()
+    started = time.perf_counter()
 
     with Session(engine) as session:
         signal_map = ensure_signals(session)
-        load_data(session, aggregated, signal_map)
+        missing = missing_signals(
+            session, signal_map, dates[0], dates[-1] + timedelta(days=1)
+        )
+        logger.info(
+            "%d missing (signal, day) pairs over %d day(s)",
+            sum(len(names) for names in missing.values()),
+            len(missing),
+        )
+
+        # Consecutive days with something missing, in bounded spans
+        days = sorted(missing)
+        spans = []
+        for day in days:
+            if (
+                spans
+                and day == spans[-1][-1] + timedelta(days=1)
+                and len(spans[-1]) < settings.backfill_span_days
+            ):
+                spans[-1].append(day)
+            else:
+                spans.append([day])
+
+        for span in spans:
+            start = datetime.combine(span[0], datetime.min.time())
+            stop = start + timedelta(days=len(span))
+            logger.info("Backfilling %s to %s", span[0], span[-1])
+            stats.merge(
+                _backfill_span(
+                    session,
+                    start,
+                    stop,
+                    {day: missing[day] for day in span},
+                    signal_map,
+                    api_client,
+                )
+            )
+
+    stats.log_summary(time.perf_counter() - started)
+
+    return stats
 
-    logger.info("ETL completed successfully for %s", date.date())
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python -m src.main YYYY-MM-DD")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Aggregate source data into the target database"
+    )
+    parser.add_argument(
+        "start",
+        nargs="?",
+        help="Date (or range start) in YYYY-MM-DD",
+    )
+    parser.add_argument(
+        "end",
+        nargs="?",
+        help="Inclusive range end in YYYY-MM-DD (default: start)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Days processed in parallel (default: ETL_WORKERS, 4)",
+    )
+    parser.add_argument(
+        "--async-extract",
+        action=argparse.BooleanOptionalAction,
+        help="Fetch each day as concurrent sub-window requests",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Download days again instead of reading them from STAGING_DIR",
+    )
+    parser.add_argument(
+        "--backfill-missing",
+        action="store_true",
+        help="Load only the signals missing from the target in the range",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Process the windows closed since the last incremental run",
+    )
+    args = parser.parse_args()
+
+    if not args.incremental and args.start is None:
+        parser.error("a start date is required unless --incremental is set")
 
     logging.basicConfig(level=logging.INFO)
-    run_etl(sys.argv[1])
+
+    if args.incremental:
+        run_incremental()
+    elif args.backfill_missing:
+        run_backfill(args.start, args.end)
+    else:
+        run_etl(
+            args.start,
+            args.end,
+            workers=args.workers,
+            async_extract=args.async_extract,
+            refresh=args.refresh,
+        )
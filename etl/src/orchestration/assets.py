@@ -1,16 +1,38 @@
-from dagster import asset, DailyPartitionsDefinition
-from src.main import run_etl
+from dagster import asset, BackfillPolicy, DailyPartitionsDefinition
 
 daily_partitions = DailyPartitionsDefinition(start_date="2025-01-01")
 
-@asset(partitions_def=daily_partitions, required_resource_keys={"source_api", "target_db"})
+@asset(
+    partitions_def=daily_partitions,
+    backfill_policy=BackfillPolicy.single_run(),
+    required_resource_keys={"source_api", "target_db"},
+)
 def daily_etl(context):
-    partition_date = context.partition_key
+    # Imported per run, keeping the code location itself quick to load
+    from src.main import run_etl
 
-    context.log.info(f"Running ETL for {partition_date}")
+    # Backfills hand the whole partition range to a single run
+    partition_range = context.partition_key_range
+
+    context.log.info(
+        f"Running ETL for {partition_range.start} to {partition_range.end}"
+    )
 
     run_etl(
-        date_str=partition_date,
+        partition_range.start,
+        partition_range.end,
         api_client=context.resources.source_api,
         engine=context.resources.target_db,
-    )
\ No newline at end of file
+    )
+
+
+@asset(required_resource_keys={"source_api", "target_db"})
+def incremental_etl(context):
+    from src.main import run_incremental
+
+    stats = run_incremental(
+        api_client=context.resources.source_api,
+        engine=context.resources.target_db,
+    )
+
+    context.log.info(f"Loaded {stats.rows['load']} rows")
@@ -1,10 +1,11 @@
 from dagster import resource
-import httpx
-from sqlalchemy import create_engine
-from src.core import settings
 
 @resource
 def source_api():
+    import httpx
+
+    from src.core import settings
+
     return httpx.Client(
         base_url=settings.source_api_url,
         timeout=30,
@@ -12,5 +13,6 @@ def source_api():
 
 @resource
 def target_db():
-    engine = create_engine(settings.target_db_url)
-    return engine
\ No newline at end of file
+    from src.db import get_engine
+
+    return get_engine()
\ No newline at end of file
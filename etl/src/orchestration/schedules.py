@@ -5,4 +5,13 @@ daily_etl_job = define_asset_job("daily_etl_job", ["daily_etl"])
 daily_schedule = ScheduleDefinition(
     job=daily_etl_job,
     cron_schedule="0 1 * * *",  # todo dia 01:00
+)
+
+incremental_etl_job = define_asset_job(
+    "incremental_etl_job", ["incremental_etl"]
+)
+
+incremental_schedule = ScheduleDefinition(
+    job=incremental_etl_job,
+    cron_schedule="*/10 * * * *",  # every closed 10-minute window
 )
\ No newline at end of file
@@ -0,0 +1,144 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ETAG_KEY = b"source_etag"
+
+
+class StagingArea:
+    """Raw extracted days kept as Parquet files under ``directory``.
+
+    Files live in one ``date=YYYY-MM-DD`` directory per day and are named
+    after the requested variables and a hash of their content, so
+    re-staging identical data leaves the file in place. The source ETag
+    in ``df.attrs["etag"]``, if any, is kept in the file metadata and
+    restored on read. Files are read through memory mapping. The least
+    recently used files are evicted once the area grows past
+    ``max_bytes``. Only days that are already over are staged.
+    """
+
+    def __init__(self, directory: Optional[str], max_bytes: int):
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _day_directory(self, day: date) -> Path:
+        return self.directory / f"date={day.isoformat()}"
+
+    @staticmethod
+    def _touch(path: Path):
+        # Explicit nanoseconds, as the filesystem clock can be too coarse
+        # to order a read and a write made right after it
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _candidates(self, day: date, variables: Iterable[str]):
+        prefix = "-".join(variables)
+        return self._day_directory(day).glob(f"{prefix}.*.parquet")
+
+    def read(
+        self, day: datetime, variables: Iterable[str]
+    ) -> Optional[pd.DataFrame]:
+        """The staged day, or None when it is not staged."""
+        if not self.enabled:
+            return None
+
+        for path in self._candidates(day.date(), variables):
+            try:
+                table = pq.read_table(path, memory_map=True)
+                self._touch(path)
+            except (FileNotFoundError, pa.ArrowInvalid):
+                continue
+
+            df = table.to_pandas()
+            etag = (table.schema.metadata or {}).get(ETAG_KEY)
+            if etag is not None:
+                df.attrs["etag"] = etag.decode()
+            return df
+
+        return None
+
+    def write(
+        self, day: datetime, variables: Iterable[str], df: pd.DataFrame
+    ) -> Optional[Path]:
+        """Stage a day that is over and return its file."""
+        if not self.enabled or day.date() >= datetime.now().date():
+            return None
+
+        variables = list(variables)
+        table = pa.Table.from_pandas(df)
+        if df.attrs.get("etag"):
+            table = table.replace_schema_metadata(
+                {**table.schema.metadata, ETAG_KEY: df.attrs["etag"].encode()}
+            )
+
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink)
+        content = sink.getvalue()
+
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        directory = self._day_directory(day.date())
+        directory.mkdir(exist_ok=True)
+        path = directory / f"{'-'.join(variables)}.{digest}.parquet"
+
+        if path.exists():
+            self._touch(path)
+            return path
+
+        partial = directory / f".{path.name}.{uuid.uuid4().hex}"
+        with pa.OSFile(str(partial), "wb") as file:
+            file.write(content)
+
+        # Atomic, so concurrent readers never see a half-written file
+        os.replace(partial, path)
+        self._touch(path)
+
+        for stale in self._candidates(day.date(), variables):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+        self._evict()
+
+        return path
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for path in self.directory.glob("date=*/*.parquet"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+
+@lru_cache(maxsize=None)
+def get_staging() -> StagingArea:
+    """Staging area configured by the settings, created on first use."""
+    from src.core import settings
+
+    return StagingArea(settings.staging_dir, settings.staging_max_bytes)
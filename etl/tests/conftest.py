@@ -0,0 +1,14 @@
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def staging_disabled():
+    """Keep tests out of the staging area configured by STAGING_DIR."""
+    from src.staging import StagingArea, get_staging
+
+    get_staging.cache_clear()
+    with patch("src.staging.get_staging", return_value=StagingArea(None, 0)):
+        yield
+    get_staging.cache_clear()
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.aggregation import (
+    STATISTICS,
+    aggregate,
+    compute_partials,
+    finalize,
+    merge_partials,
+    register_statistic,
+)
+
+AGGREGATIONS = ["mean", "min", "max", "std"]
+
+
+def resample(df: pd.DataFrame, aggregations=AGGREGATIONS) -> pd.DataFrame:
+    expected = df.resample("10min").agg(aggregations)
+    expected.columns = [f"{var}_{agg}" for var, agg in expected.columns]
+    return expected
+
+
+class TestAggregate:
+    def test_matches_resample(self):
+        rng = np.random.default_rng(42)
+        timestamps = pd.date_range("2024-01-15 00:00:00", periods=1440, freq="1min")
+        df = pd.DataFrame({
+            "wind_speed": rng.normal(6.0, 1.5, len(timestamps)),
+            "power": rng.normal(216.0, 50.0, len(timestamps)),
+        }, index=timestamps)
+
+        pd.testing.assert_frame_equal(
+            aggregate(df, AGGREGATIONS), resample(df), check_freq=False, rtol=1e-12
+        )
+
+    def test_gaps_nans_and_single_samples(self):
+        timestamps = pd.DatetimeIndex([
+            "2024-01-15 10:03:00",
+            "2024-01-15 10:04:00",
+            "2024-01-15 10:17:00",  # single sample window
+            "2024-01-15 10:45:00",  # two empty windows before it
+            "2024-01-15 10:46:00",
+        ], name="timestamp")
+        df = pd.DataFrame({
+            "wind_speed": [1.0, np.nan, 3.0, np.nan, np.nan],
+            "power": [10.0, 20.0, 30.0, 40.0, 41.0],
+        }, index=timestamps)
+
+        result = aggregate(df, AGGREGATIONS + ["count", "sum"])
+
+        pd.testing.assert_frame_equal(
+            result,
+            resample(df, AGGREGATIONS + ["count", "sum"]),
+            check_freq=False,
+        )
+        assert result.index[0] == pd.Timestamp("2024-01-15 10:00:00")
+        assert np.isnan(result.loc["2024-01-15 10:10:00", "power_std"])
+
+    def test_unsorted_index(self):
+        timestamps = pd.date_range("2024-01-15 10:00:00", periods=30, freq="1min")
+        df = pd.DataFrame({"power": np.arange(30.0)}, index=timestamps)
+        shuffled = df.sample(frac=1, random_state=1)
+
+        pd.testing.assert_frame_equal(
+            aggregate(shuffled, AGGREGATIONS), resample(df), check_freq=False
+        )
+
+    def test_unknown_aggregation(self):
+        timestamps = pd.date_range("2024-01-15 10:00:00", periods=2, freq="1min")
+        df = pd.DataFrame({"power": [1.0, 2.0]}, index=timestamps)
+
+        with pytest.raises(ValueError):
+            aggregate(df, ["median"])
+
+    def test_register_statistic(self):
+        @register_statistic("range")
+        def _range(partials):
+            return partials["max"] - partials["min"]
+
+        try:
+            timestamps = pd.date_range("2024-01-15 10:00:00", periods=3, freq="1min")
+            df = pd.DataFrame({"power": [1.0, 5.0, 2.0]}, index=timestamps)
+
+            result = aggregate(df, ["range"])
+
+            assert result["power_range"].tolist() == [4.0]
+        finally:
+            del STATISTICS["range"]
+
+
+class TestMergePartials:
+    def test_cascade_matches_resample(self):
+        rng = np.random.default_rng(7)
+        timestamps = pd.date_range("2024-01-15 00:00:00", periods=3 * 1440, freq="1min")
+        df = pd.DataFrame({
+            "wind_speed": rng.normal(6.0, 1.5, len(timestamps)),
+            "power": rng.normal(216.0, 50.0, len(timestamps)),
+        }, index=timestamps)
+        df.iloc[100:400, 0] = np.nan  # an hour and more without wind_speed
+        aggregations = AGGREGATIONS + ["count", "sum"]
+
+        index, partials = compute_partials(df)
+        hourly_index, hourly = merge_partials(index, partials, "1h")
+        daily_index, daily = merge_partials(hourly_index, hourly, "1D")
+
+        for frequency, result in [
+            ("1h", finalize(hourly_index, hourly, df.columns, aggregations)),
+            ("1D", finalize(daily_index, daily, df.columns, aggregations)),
+        ]:
+            expected = df.resample(frequency).agg(aggregations)
+            expected.columns = [f"{var}_{agg}" for var, agg in expected.columns]
+            pd.testing.assert_frame_equal(
+                result, expected, check_freq=False, check_dtype=False, rtol=1e-9
+            )
+
+    def test_large_values_small_spread(self):
+        rng = np.random.default_rng(3)
+        timestamps = pd.date_range("2024-01-15 00:00:00", periods=1440, freq="1min")
+        df = pd.DataFrame({
+            "power": 1e6 + rng.normal(0.0, 0.01, len(timestamps)),
+        }, index=timestamps)
+
+        pd.testing.assert_frame_equal(
+            aggregate(df, ["std"]), resample(df, ["std"]), check_freq=False, rtol=1e-6
+        )
+
+        index, partials = merge_partials(*compute_partials(df), "1h")
+        expected = df.resample("1h").agg(["std"])
+        expected.columns = [f"{var}_{agg}" for var, agg in expected.columns]
+        pd.testing.assert_frame_equal(
+            finalize(index, partials, df.columns, ["std"]),
+            expected,
+            check_freq=False,
+            rtol=1e-6,
+        )
+
+    def test_suffix(self):
+        timestamps = pd.date_range("2024-01-15 10:00:00", periods=2, freq="10min")
+        df = pd.DataFrame({"power": [1.0, 3.0]}, index=timestamps)
+
+        index, partials = merge_partials(*compute_partials(df), "1h")
+        result = finalize(index, partials, df.columns, ["mean"], suffix="_1h")
+
+        assert result.to_dict() == {"power_mean_1h": {pd.Timestamp("2024-01-15 10:00:00"): 2.0}}
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.extract import (
+    ARROW,
+    decode_response,
+    fetch_source_data_async,
+    split_windows,
+)
+
+
+def source_api(failures=None):
+    """Mock source API returning one row per minute of the requested span."""
+    failures = failures if failures is not None else {}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = datetime.fromisoformat(request.url.params["start"])
+        end = datetime.fromisoformat(request.url.params["end"])
+        requests.append((start, end))
+
+        if failures.get(start, 0) > 0:
+            failures[start] -= 1
+            return httpx.Response(503)
+
+        timestamps = pd.date_range(start, end, freq="1min")
+        return httpx.Response(200, json=[
+            {"timestamp": timestamp.isoformat(), "power": float(i)}
+            for i, timestamp in enumerate(timestamps)
+        ])
+
+    client = httpx.AsyncClient(
+        base_url="http://test.com", transport=httpx.MockTransport(handler)
+    )
+    return client, requests
+
+
+class TestSplitWindows:
+    def test_split_windows(self):
+        start = datetime(2024, 1, 15)
+        windows = split_windows(start, start + timedelta(days=1), timedelta(hours=10))
+
+        assert [lower for lower, _ in windows] == [
+            datetime(2024, 1, 15, 0), datetime(2024, 1, 15, 10), datetime(2024, 1, 15, 20)
+        ]
+        assert windows[0][1] == datetime(2024, 1, 15, 9, 59, 59, 999999)
+        assert windows[-1][1] == datetime(2024, 1, 15, 23, 59, 59, 999999)
+
+
+class TestDecodeResponse:
+    def test_decode_arrow(self):
+        table = pa.table({
+            "timestamp": pa.array([datetime(2024, 1, 15, 0, 0), datetime(2024, 1, 15, 0, 1)], pa.timestamp("us")),
+            "power": pa.array([1.0, 2.0], pa.float64()),
+        })
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        response = httpx.Response(
+            200, content=sink.getvalue().to_pybytes(), headers={"content-type": ARROW}
+        )
+
+        df = decode_response(response)
+
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index[1] == pd.Timestamp("2024-01-15 00:01:00")
+        assert df["power"].dtype == "float64"
+        assert df["power"].tolist() == [1.0, 2.0]
+
+    def test_decode_json_fallback(self):
+        response = httpx.Response(200, json=[
+            {"timestamp": "2024-01-15T00:00:00", "power": 1.0}
+        ])
+
+        df = decode_response(response)
+
+        assert df.index[0] == pd.Timestamp("2024-01-15 00:00:00")
+        assert df["power"].tolist() == [1.0]
+
+
+class TestFetchSourceDataAsync:
+    def test_fetch_concatenates_in_order(self):
+        client, requests = source_api()
+        start = datetime(2024, 1, 15)
+
+        df = asyncio.run(fetch_source_data_async(
+            start, start + timedelta(days=1), ["power"],
+            client=client, window=timedelta(hours=3), concurrency=2,
+        ))
+
+        assert len(requests) == 8
+        assert len(df) == 1440
+        assert df.index.is_monotonic_increasing
+        assert df.index[0] == pd.Timestamp("2024-01-15 00:00:00")
+        assert df.index[-1] == pd.Timestamp("2024-01-15 23:59:00")
+
+    def test_fetch_retries_server_errors(self):
+        start = datetime(2024, 1, 15)
+        client, requests = source_api(failures={start: 2})
+
+        df = asyncio.run(fetch_source_data_async(
+            start, start + timedelta(hours=1), ["power"],
+            client=client, window=timedelta(hours=1), retries=2, backoff=0,
+        ))
+
+        assert len(requests) == 3
+        assert len(df) == 60
+
+    def test_fetch_gives_up_after_retries(self):
+        start = datetime(2024, 1, 15)
+        client, _ = source_api(failures={start: 5})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(fetch_source_data_async(
+                start, start + timedelta(hours=1), ["power"],
+                client=client, window=timedelta(hours=1), retries=1, backoff=0,
+            ))
@@ -1,9 +1,30 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from datetime import datetime
+import httpx
+import numpy as np
 import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, delete, select
 
-from src.main import parse_date, fetch_source_data, aggregate_data, ensure_signals, load_data, run_etl
+from src.db.models import Signal, Data, SourceValidator, Watermark
+from src.extract import NotModified
+from src.staging import StagingArea
+
+from src.main import (
+    _signal_cache,
+    parse_date,
+    parse_date_range,
+    fetch_source_data,
+    aggregate_data,
+    ensure_signals,
+    load_data,
+    rollup_data,
+    run_backfill,
+    run_etl,
+    run_incremental,
+)
 
 
 class TestParseDate:
@@ -16,15 +37,31 @@ class TestParseDate:
             parse_date("15-01-2024")
 
 
+class TestParseDateRange:
+    def test_parse_date_range(self):
+        result = parse_date_range("2024-01-30", "2024-02-02")
+        assert result[0] == datetime(2024, 1, 30)
+        assert result[-1] == datetime(2024, 2, 2)
+        assert len(result) == 4
+
+    def test_parse_date_range_single_day(self):
+        assert parse_date_range("2024-01-15") == [datetime(2024, 1, 15)]
+
+    def test_parse_date_range_reversed(self):
+        with pytest.raises(ValueError):
+            parse_date_range("2024-01-15", "2024-01-14")
+
+
 class TestFetchSourceData:
-    @patch('src.main.httpx.Client')
-    @patch('src.main.settings')
+    @patch('httpx.Client')
+    @patch('src.core.settings')
     def test_fetch_source_data_success(self, mock_settings, mock_client_class):
         mock_settings.source_api_url = "http://test.com"
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         
         mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
         mock_response.json.return_value = [
             {"timestamp": "2024-01-15T10:00:00", "wind_speed": 10.5, "power": 100.0}
         ]
@@ -36,14 +73,15 @@ class TestFetchSourceData:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
 
-    @patch('src.main.httpx.Client')
-    @patch('src.main.settings')
+    @patch('httpx.Client')
+    @patch('src.core.settings')
     def test_fetch_source_data_empty(self, mock_settings, mock_client_class):
         mock_settings.source_api_url = "http://test.com"
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         
         mock_response = Mock()
+        mock_response.headers = {"content-type": "application/json"}
         mock_response.json.return_value = []
         mock_client.get.return_value = mock_response
         
@@ -52,6 +90,16 @@ class TestFetchSourceData:
         with pytest.raises(RuntimeError):
             fetch_source_data(date, client=mock_client)
 
+    def test_fetch_source_data_not_modified(self):
+        mock_client = Mock()
+        mock_client.get.return_value = Mock(status_code=304)
+
+        with pytest.raises(NotModified):
+            fetch_source_data(datetime(2024, 1, 15), client=mock_client, etag='W/"abc"')
+
+        headers = mock_client.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == 'W/"abc"'
+
 
 class TestAggregateData:
     def test_aggregate_data(self):
@@ -66,6 +114,23 @@ class TestAggregateData:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 2  # 4 records resampled to 10min
 
+    def test_aggregate_data_drops_empty_windows(self):
+        timestamps = pd.DatetimeIndex([
+            "2024-01-15 10:00:00",
+            "2024-01-15 10:35:00",  # two empty windows before it
+        ])
+        df = pd.DataFrame({
+            "wind_speed": [10.0, np.nan],
+            "power": [100.0, 110.0]
+        }, index=timestamps)
+
+        result = aggregate_data(df)
+
+        assert result.loc["2024-01-15 10:10:00"].isna().all()
+        assert result.loc["2024-01-15 10:20:00"].isna().all()
+        assert result.filter(like="wind_speed").loc["2024-01-15 10:30:00"].isna().all()
+        assert result.loc["2024-01-15 10:30:00", "power_count"] == 1
+
     def test_aggregate_data_empty(self):
         df = pd.DataFrame()
         with pytest.raises(TypeError):
@@ -73,72 +138,144 @@ class TestAggregateData:
 
 
 class TestEnsureSignals:
-    def test_ensure_signals_new(self, mock_session):
-        mock_session.exec.return_value.all.return_value = []
-        
-        result = ensure_signals(mock_session)
-        
-        assert len(result) == 8  # 2 variables * 4 aggregations
-        mock_session.add.assert_called()
-        mock_session.commit.assert_called()
+    def test_ensure_signals_new(self, db_session):
+        result = ensure_signals(db_session)
 
-    def test_ensure_signals_existing(self, mock_session):
-        from src.db.models import Signal
-        existing_signals = [
-            Signal(id=1, name="wind_speed_mean"),
-            Signal(id=2, name="wind_speed_min"),
-            Signal(id=3, name="wind_speed_max"),
-            Signal(id=4, name="wind_speed_std"),
-            Signal(id=5, name="power_mean"),
-            Signal(id=6, name="power_min"),
-            Signal(id=7, name="power_max"),
-            Signal(id=8, name="power_std"),
-        ]
-        mock_session.exec.return_value.all.return_value = existing_signals
-        
-        result = ensure_signals(mock_session)
-        
-        assert len(result) == 8
-        mock_session.add.assert_not_called()
+        # 2 variables * (4 aggregations + 3 partials) * 3 resolutions
+        assert len(result) == 42
+        assert result["wind_speed_mean"] == 1
+        assert result["wind_speed_std"] == 2
+        assert "power_std_1d" in result
+        assert len(db_session.exec(select(Signal)).all()) == 42
+
+    def test_ensure_signals_existing(self, db_session):
+        first = ensure_signals(db_session)
+        _signal_cache.clear()
+
+        result = ensure_signals(db_session)
+
+        assert result == first
+        assert len(db_session.exec(select(Signal)).all()) == 42
+
+    def test_ensure_signals_cached(self, db_session):
+        first = ensure_signals(db_session)
+
+        with patch.object(db_session, "exec") as mock_exec:
+            result = ensure_signals(db_session)
+
+        assert result == first
+        mock_exec.assert_not_called()
 
 
 class TestLoadData:
-    def test_load_data_new_records(self, mock_session):
+    def test_load_data_new_records(self, db_session):
         timestamps = pd.date_range("2024-01-15 10:00:00", periods=2, freq="10min")
         aggregated = pd.DataFrame({
-            "wind_speed_mean": [10.5, 11.5]
+            "wind_speed_mean": [10.5, 11.5],
+            "wind_speed_std": [float("nan"), 0.5],
         }, index=timestamps)
-        
-        signal_map = {"wind_speed_mean": 1}
-        mock_session.exec.return_value.first.return_value = None
-        
-        load_data(mock_session, aggregated, signal_map)
-        
-        mock_session.bulk_save_objects.assert_called()
-        mock_session.commit.assert_called()
 
-    def test_load_data_skip_existing(self, mock_session):
+        signal_map = {"wind_speed_mean": 1, "wind_speed_std": 2}
+
+        inserted = load_data(db_session, aggregated, signal_map)
+
+        rows = db_session.exec(select(Data).order_by(Data.signal_id)).all()
+        assert inserted == 3
+        assert [(row.signal_id, row.value) for row in rows] == [
+            (1, 10.5), (1, 11.5), (2, 0.5)
+        ]
+
+    def test_load_data_skip_existing(self, db_session):
         timestamps = pd.date_range("2024-01-15 10:00:00", periods=1, freq="10min")
         aggregated = pd.DataFrame({
             "wind_speed_mean": [10.5]
         }, index=timestamps)
-        
+
         signal_map = {"wind_speed_mean": 1}
-        existing_data = Mock()
-        mock_session.exec.return_value.first.return_value = existing_data
-        
-        load_data(mock_session, aggregated, signal_map)
-        
-        mock_session.bulk_save_objects.assert_not_called()
+
+        load_data(db_session, aggregated, signal_map)
+        load_data(db_session, aggregated * 2, signal_map)
+
+        rows = db_session.exec(select(Data)).all()
+        assert len(rows) == 1
+        assert rows[0].value == 10.5
+
+    def test_load_data_batches(self, mock_session):
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        timestamps = pd.date_range("2024-01-15 10:00:00", periods=5, freq="10min")
+        aggregated = pd.DataFrame({
+            "wind_speed_mean": [10.0, 11.0, 12.0, 13.0, 14.0]
+        }, index=timestamps)
+
+        load_data(mock_session, aggregated, {"wind_speed_mean": 1}, batch_size=2)
+
+        assert mock_session.execute.call_count == 3
+        mock_session.commit.assert_called_once()
+
+
+class TestRollupData:
+    def test_rollup_from_stored_partials(self, engine):
+        timestamps = pd.date_range("2024-01-15", periods=2 * 1440, freq="1min")
+        df = pd.DataFrame({
+            "wind_speed": np.arange(len(timestamps)) % 17 * 0.5,
+            "power": np.arange(len(timestamps)) % 29 * 10.0,
+        }, index=timestamps)
+
+        with Session(engine) as session:
+            load_data(session, aggregate_data(df), ensure_signals(session))
+            written = rollup_data(session, datetime(2024, 1, 15), datetime(2024, 1, 17))
+            session.commit()
+            stored = dict(session.exec(
+                select(Signal.name, Data.value).join(Signal).where(
+                    Data.timestamp == datetime(2024, 1, 16, 5)
+                )
+            ).all())
+            daily = dict(session.exec(
+                select(Signal.name, Data.value).join(Signal).where(
+                    Data.timestamp == datetime(2024, 1, 16),
+                    Signal.name.like("%_1d"),
+                )
+            ).all())
+
+        hour = df.loc["2024-01-16 05:00":"2024-01-16 05:59"]
+        day = df.loc["2024-01-16"]
+        # (48 hours + 2 days) * 2 variables * 7 statistics
+        assert written == 700
+        assert stored["power_mean_1h"] == pytest.approx(hour["power"].mean())
+        assert stored["wind_speed_std_1h"] == pytest.approx(hour["wind_speed"].std())
+        assert stored["power_count_1h"] == 60
+        assert daily["power_max_1d"] == day["power"].max()
+        assert daily["wind_speed_std_1d"] == pytest.approx(day["wind_speed"].std())
+
+    @patch('src.main.fetch_source_range')
+    def test_run_incremental_updates_open_rollups(self, mock_fetch, engine):
+        timestamps = pd.date_range("2025-01-01 00:00:00", periods=60, freq="1min")
+        df = pd.DataFrame({"wind_speed": 1.0, "power": np.arange(60.0)}, index=timestamps)
+        mock_fetch.side_effect = lambda start, stop, client=None: df[start:stop - pd.Timedelta("1min")]
+
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 0, 35))
+        with Session(engine) as session:
+            partial_hour = session.exec(
+                select(Data.value).join(Signal).where(Signal.name == "power_mean_1h")
+            ).one()
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 1, 5))
+        with Session(engine) as session:
+            full_hour = session.exec(
+                select(Data.value).join(Signal).where(Signal.name == "power_mean_1h")
+            ).one()
+
+        assert partial_hour == pytest.approx(np.arange(30.0).mean())
+        assert full_hour == pytest.approx(np.arange(60.0).mean())
 
 
 class TestRunETL:
+    @patch('src.main.rollup_data', Mock(return_value=0))
     @patch('src.main.load_data')
     @patch('src.main.ensure_signals')
     @patch('src.main.aggregate_data')
     @patch('src.main.fetch_source_data')
     @patch('src.main.parse_date')
-    @patch('src.main.Session')
+    @patch('sqlmodel.Session')
     def test_run_etl_success(self, mock_session_class, mock_parse_date, 
                            mock_fetch, mock_aggregate, mock_ensure_signals, mock_load_data):
         mock_parse_date.return_value = datetime(2024, 1, 15)
@@ -157,6 +294,244 @@ class TestRunETL:
         mock_ensure_signals.assert_called_once()
         mock_load_data.assert_called_once()
 
+    @patch('src.main.rollup_data', Mock(return_value=0))
+    @patch('src.main.load_data')
+    @patch('src.main.ensure_signals')
+    @patch('src.main.fetch_source_data')
+    @patch('sqlmodel.Session')
+    def test_run_etl_range(self, mock_session_class, mock_fetch,
+                           mock_ensure_signals, mock_load_data):
+        timestamps = pd.date_range("2024-01-15", periods=20, freq="1min")
+        mock_fetch.return_value = pd.DataFrame({"wind_speed": 1.0}, index=timestamps)
+        mock_ensure_signals.return_value = {"wind_speed_mean": 1}
+        mock_load_data.return_value = 2
+
+        stats = run_etl("2024-01-15", "2024-01-17", workers=2, api_client=Mock())
+
+        fetched = sorted(call.args[0] for call in mock_fetch.call_args_list)
+        assert fetched == [datetime(2024, 1, day) for day in (15, 16, 17)]
+        assert stats.days == 3
+        assert stats.rows == {"extract": 60, "transform": 6, "load": 6}
+
+    @patch('src.main.rollup_data', Mock(return_value=0))
+    @patch('src.main.load_data')
+    @patch('src.main.ensure_signals')
+    @patch('src.main.fetch_source_data')
+    @patch('sqlmodel.Session')
+    def test_run_etl_range_failure(self, mock_session_class, mock_fetch,
+                                   mock_ensure_signals, mock_load_data):
+        def fetch(date, client=None, etag=None):
+            if date.day == 16:
+                raise RuntimeError("No data returned from source API")
+            return pd.DataFrame({"wind_speed": [1.0]}, index=[date])
+
+        mock_fetch.side_effect = fetch
+        mock_load_data.return_value = 1
+
+        with pytest.raises(RuntimeError, match="2024-01-16"):
+            run_etl("2024-01-15", "2024-01-17", workers=2, api_client=Mock())
+
+        assert mock_load_data.call_count == 2
+
+    def test_run_etl_skips_unmodified_day(self, engine):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == 'W/"day"':
+                return httpx.Response(304, headers={"etag": 'W/"day"'})
+            timestamps = pd.date_range("2024-01-15", periods=20, freq="1min")
+            return httpx.Response(200, headers={"etag": 'W/"day"'}, json=[
+                {"timestamp": timestamp.isoformat(), "wind_speed": 1.0}
+                for timestamp in timestamps
+            ])
+
+        client = httpx.Client(base_url="http://test.com", transport=httpx.MockTransport(handler))
+
+        first = run_etl("2024-01-15", engine=engine, api_client=client)
+        second = run_etl("2024-01-15", engine=engine, api_client=client)
+
+        # 2 windows, 1 hour and 1 day of 7 wind_speed statistics each
+        assert first.rows["load"] == 28
+        assert second.rows == {"extract": 0, "transform": 0, "load": 0}
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == 'W/"day"'
+        with Session(engine) as session:
+            assert session.get(SourceValidator, "2024-01-15").etag == 'W/"day"'
+
+    def test_run_etl_reads_staged_day(self, engine, tmp_path):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            timestamps = pd.date_range("2024-01-15", periods=20, freq="1min")
+            return httpx.Response(200, headers={"etag": 'W/"day"'}, json=[
+                {"timestamp": timestamp.isoformat(), "wind_speed": 1.0}
+                for timestamp in timestamps
+            ])
+
+        client = httpx.Client(base_url="http://test.com", transport=httpx.MockTransport(handler))
+        staging = StagingArea(str(tmp_path), max_bytes=10**9)
+
+        with patch("src.staging.get_staging", return_value=staging):
+            first = run_etl("2024-01-15", engine=engine, api_client=client)
+            loaded = run_etl("2024-01-15", engine=engine, api_client=client)
+            with Session(engine) as session:
+                session.delete(session.get(SourceValidator, "2024-01-15"))
+                session.commit()
+            staged = run_etl("2024-01-15", engine=engine, api_client=client)
+            refreshed = run_etl("2024-01-15", engine=engine, api_client=client, refresh=True)
+
+        # Already loaded with the staged ETag, so nothing is redone
+        assert loaded.rows["extract"] == 0
+        assert first.rows["extract"] == staged.rows["extract"] == 20
+        assert staged.rows["transform"] == first.rows["transform"]
+        assert refreshed.rows["extract"] == 20
+        assert len(requests) == 2
+        assert "if-none-match" not in requests[1].headers
+        with Session(engine) as session:
+            # Restored from the staged file
+            assert session.get(SourceValidator, "2024-01-15").etag == 'W/"day"'
+        assert list(tmp_path.glob("date=2024-01-15/wind_speed-power.*.parquet"))
+
+
+class TestRunBackfill:
+    def test_loads_only_missing_signals(self, engine):
+        requests = []
+        served = ["wind_speed"]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            start = pd.Timestamp(request.url.params["start"])
+            end = pd.Timestamp(request.url.params["end"])
+            timestamps = pd.date_range(start, end, freq="1min")
+            variables = [
+                variable for variable in request.url.params.get_list("variables")
+                if variable in served
+            ]
+            return httpx.Response(200, json=[
+                {"timestamp": timestamp.isoformat(), **{
+                    variable: float(position % 7) for variable in variables
+                }}
+                for position, timestamp in enumerate(timestamps)
+            ])
+
+        client = httpx.Client(base_url="http://test.com", transport=httpx.MockTransport(handler))
+        # One worker, as the in-memory engine shares a single connection
+        run_etl("2024-01-15", "2024-01-16", workers=1, engine=engine, api_client=client)
+
+        def values(pattern):
+            with Session(engine) as session:
+                return sorted(session.exec(
+                    select(Data.timestamp, Signal.name, Data.value)
+                    .join(Signal).where(Signal.name.like(pattern))
+                ).all())
+
+        # A statistic added after the fact, and a variable now served
+        std = values("wind_speed_std%")
+        with Session(engine) as session:
+            for signal in session.exec(select(Signal).where(Signal.name.like("wind_speed_std%"))):
+                session.exec(delete(Data).where(Data.signal_id == signal.id))
+            session.commit()
+        served.append("power")
+        requests.clear()
+
+        stats = run_backfill("2024-01-15", "2024-01-16", engine=engine, api_client=client)
+        again = run_backfill("2024-01-15", "2024-01-16", engine=engine, api_client=client)
+
+        assert values("wind_speed_std%") == std
+        assert len(values("power_mean")) == 2 * 144
+        assert len(values("power_max_1d")) == 2
+        # One request for both days, and only for the new variable
+        assert len(requests) == 1
+        assert requests[0].url.params.get_list("variables") == ["power"]
+        # (2 days * 144 windows + 48 hours + 2 days) * (7 power
+        # statistics + wind_speed_std)
+        assert stats.rows["load"] == (288 + 48 + 2) * (7 + 1)
+        assert again.rows["load"] == 0
+        assert len(requests) == 1
+
+
+class TestRunIncremental:
+    @patch('src.main.fetch_source_range')
+    def test_run_incremental_loads_closed_windows(self, mock_fetch, engine):
+        timestamps = pd.date_range("2025-01-01 00:00:00", "2025-01-01 00:34:00", freq="1min")
+        mock_fetch.return_value = pd.DataFrame({
+            "wind_speed": 5.0, "power": 100.0
+        }, index=timestamps)
+
+        stats = run_incremental(engine=engine, now=datetime(2025, 1, 1, 0, 35))
+
+        mock_fetch.assert_called_once_with(
+            datetime(2025, 1, 1), datetime(2025, 1, 1, 0, 30), client=None
+        )
+        assert stats.rows["transform"] == 3
+        with Session(engine) as session:
+            watermark = session.get(Watermark, "incremental_etl")
+            loaded = session.exec(select(Data.timestamp).distinct()).all()
+        assert watermark.timestamp == datetime(2025, 1, 1, 0, 30)
+        assert max(loaded) == datetime(2025, 1, 1, 0, 20)
+
+    @patch('src.main.fetch_source_range')
+    def test_run_incremental_resumes_from_last_window_with_data(self, mock_fetch, engine):
+        timestamps = pd.date_range("2025-01-01 00:30:00", periods=5, freq="1min")
+        mock_fetch.return_value = pd.DataFrame({"wind_speed": 5.0}, index=timestamps)
+        with Session(engine) as session:
+            session.add(Watermark(name="incremental_etl", timestamp=datetime(2025, 1, 1, 0, 30)))
+            session.commit()
+
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 1, 5))
+        mock_fetch.return_value = pd.DataFrame()
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 1, 5))
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 1, 5))
+
+        # The empty windows up to the closed edge are asked for again
+        assert mock_fetch.call_args_list == [
+            call(datetime(2025, 1, 1, 0, 30), datetime(2025, 1, 1, 1, 0), client=None),
+            call(datetime(2025, 1, 1, 0, 40), datetime(2025, 1, 1, 1, 0), client=None),
+            call(datetime(2025, 1, 1, 0, 40), datetime(2025, 1, 1, 1, 0), client=None),
+        ]
+
+    @patch('src.main.fetch_source_range')
+    def test_run_incremental_skips_empty_span_behind_closed(self, mock_fetch, engine):
+        mock_fetch.return_value = pd.DataFrame()
+
+        run_incremental(engine=engine, now=datetime(2025, 1, 3))
+
+        with Session(engine) as session:
+            watermark = session.get(Watermark, "incremental_etl")
+        assert watermark.timestamp == datetime(2025, 1, 2)
+
+    @patch('src.main.fetch_source_range')
+    def test_daily_run_overwrites_incremental_windows(self, mock_fetch, engine):
+        timestamps = pd.date_range("2025-01-01", periods=10, freq="1min")
+        power = pd.Series(np.arange(10.0), index=timestamps)
+        mock_fetch.return_value = pd.DataFrame({"wind_speed": 1.0, "power": power[:5]})
+
+        run_incremental(engine=engine, now=datetime(2025, 1, 1, 0, 15))
+        mock_fetch.return_value = pd.DataFrame({"wind_speed": 1.0, "power": power})
+        run_etl("2025-01-01", engine=engine)
+
+        with Session(engine) as session:
+            mean = session.exec(
+                select(Data.value).join(Signal).where(Signal.name == "power_mean")
+            ).one()
+        # Rows late for the incremental run are in the daily aggregate
+        assert mean == pytest.approx(4.5)
+
+    @patch('src.main.fetch_source_range')
+    @patch('src.main.load_data')
+    def test_run_incremental_failure_keeps_watermark(self, mock_load_data, mock_fetch, engine):
+        timestamps = pd.date_range("2025-01-01 00:00:00", periods=20, freq="1min")
+        mock_fetch.return_value = pd.DataFrame({"wind_speed": 5.0}, index=timestamps)
+        mock_load_data.side_effect = RuntimeError("database unavailable")
+
+        with pytest.raises(RuntimeError):
+            run_incremental(engine=engine, now=datetime(2025, 1, 1, 0, 20))
+
+        with Session(engine) as session:
+            assert session.get(Watermark, "incremental_etl") is None
+
 
 @pytest.fixture
 def mock_session():
@@ -167,3 +542,32 @@ def mock_session():
     session.refresh = Mock()
     session.bulk_save_objects = Mock()
     return session
+
+
+@pytest.fixture(autouse=True)
+def clear_signal_cache():
+    _signal_cache.clear()
+    yield
+    _signal_cache.clear()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db_session(engine):
+    with Session(engine) as session:
+        session.add_all([
+            Signal(id=1, name="wind_speed_mean"),
+            Signal(id=2, name="wind_speed_std"),
+        ])
+        session.commit()
+        yield session
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pandas as pd
+
+from src.staging import StagingArea
+
+DAY = datetime(2025, 1, 1)
+VARIABLES = ["wind_speed", "power"]
+
+
+def day_frame(day: datetime = DAY, value: float = 1.0) -> pd.DataFrame:
+    timestamps = pd.date_range(day, periods=1440, freq="1min", name="timestamp")
+    return pd.DataFrame({"wind_speed": value, "power": value * 100}, index=timestamps)
+
+
+class TestStagingArea:
+    def test_round_trip(self, tmp_path):
+        staging = StagingArea(str(tmp_path), max_bytes=10**9)
+        df = day_frame()
+
+        path = staging.write(DAY, VARIABLES, df)
+
+        assert path.parent.name == "date=2025-01-01"
+        pd.testing.assert_frame_equal(staging.read(DAY, VARIABLES), df, check_freq=False)
+        assert staging.read(DAY, ["power"]) is None
+        assert staging.read(datetime(2025, 1, 2), VARIABLES) is None
+
+    def test_keeps_source_etag(self, tmp_path):
+        staging = StagingArea(str(tmp_path), max_bytes=10**9)
+        df = day_frame()
+        df.attrs["etag"] = 'W/"abc"'
+
+        staging.write(DAY, VARIABLES, df)
+        staging.write(datetime(2025, 1, 2), VARIABLES, day_frame(datetime(2025, 1, 2)))
+
+        assert staging.read(DAY, VARIABLES).attrs["etag"] == 'W/"abc"'
+        assert "etag" not in staging.read(datetime(2025, 1, 2), VARIABLES).attrs
+
+    def test_content_hash_replaces_changed_day(self, tmp_path):
+        staging = StagingArea(str(tmp_path), max_bytes=10**9)
+
+        first = staging.write(DAY, VARIABLES, day_frame())
+        same = staging.write(DAY, VARIABLES, day_frame())
+        changed = staging.write(DAY, VARIABLES, day_frame(value=2.0))
+
+        assert same == first
+        assert changed != first
+        assert not first.exists()
+        assert staging.read(DAY, VARIABLES)["wind_speed"].iloc[0] == 2.0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        staging = StagingArea(str(tmp_path), max_bytes=10**9)
+        size = staging.write(DAY, VARIABLES, day_frame()).stat().st_size
+        staging.max_bytes = 2 * size + 1000  # room for two days
+
+        for day in (2, 3):
+            staging.read(DAY, VARIABLES)  # keeps the first day recent
+            staging.write(datetime(2025, 1, day), VARIABLES, day_frame(datetime(2025, 1, day)))
+
+        assert staging.read(DAY, VARIABLES) is not None
+        assert staging.read(datetime(2025, 1, 2), VARIABLES) is None
+        assert staging.read(datetime(2025, 1, 3), VARIABLES) is not None
+
+    def test_skips_current_day_and_disabled_area(self, tmp_path):
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+
+        assert StagingArea(str(tmp_path), 10**9).write(today, VARIABLES, day_frame(today)) is None
+        assert StagingArea(None, 10**9).write(DAY, VARIABLES, day_frame()) is None
+        assert StagingArea(None, 10**9).read(DAY, VARIABLES) is None
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import time allowed for the CLI module, in microseconds
+BUDGET_US = 250_000
+HEAVY = ["pandas", "numpy", "httpx", "sqlalchemy", "sqlmodel", "pydantic_settings", "pyarrow"]
+
+
+def import_times(module: str) -> dict:
+    """Cumulative ``-X importtime`` of each module loaded by ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestStartup:
+    def test_cli_import_is_light(self):
+        times = import_times("src.main")
+
+        assert [module for module in HEAVY if module in times] == []
+        assert times["src.main"] < BUDGET_US
+
+    def test_code_location_defers_etl_imports(self):
+        pytest.importorskip("dagster")
+
+        times = import_times("src.orchestration.definitions")
+
+        assert "src.main" not in times
+        assert "src.extract" not in times
+        assert "src.db.models" not in times